@@ -4,9 +4,338 @@ Data Analysis Example
 Quick script to analyze collected simulation data
 """
 
-import pandas as pd
-import sys
+import argparse
+import csv
+import math
+from collections import Counter
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas' CSV reader (CSV only)
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:  # polars is optional; the chunked pandas/pyarrow path is used instead
+    pl = None
+
+# Non-prefixed columns consumed by the analysis
+INSIGHT_COLUMNS = ('timestamp', 'benchmark', 'duration')
+
+# Rows per chunk when streaming the dataset through pandas
+CHUNK_ROWS = 100_000
+
+
+def _is_parquet(path: str) -> bool:
+    """Whether a dataset path refers to the Parquet copy of the dataset."""
+    return Path(path).suffix == '.parquet'
+
+
+def _read_header(csv_file: str) -> List[str]:
+    """Return the column names of a dataset file without parsing its rows."""
+    if _is_parquet(csv_file):
+        return pq.read_schema(csv_file).names
+    with open(csv_file, newline='') as f:
+        return next(csv.reader(f), [])
+
+
+def _needed_columns(columns: List[str], extra: tuple = INSIGHT_COLUMNS) -> List[str]:
+    """Select the columns the analysis actually reads."""
+    return [c for c in columns if c in extra or c.startswith(('param_', 'metric_'))]
+
+
+def _split_columns(columns: List[str]) -> Tuple[List[str], List[str]]:
+    """Split column names into (param_cols, metric_cols) in a single pass."""
+    param_cols: List[str] = []
+    metric_cols: List[str] = []
+    for col in columns:
+        if col.startswith('param_'):
+            param_cols.append(col)
+        elif col.startswith('metric_'):
+            metric_cols.append(col)
+    return param_cols, metric_cols
+
+
+def _column_types(columns: List[str]) -> Dict[str, Any]:
+    """Arrow types for the analysis columns: strings for labels/params, floats otherwise."""
+    return {
+        col: pa.string() if col in ('timestamp', 'benchmark') or col.startswith('param_') else pa.float64()
+        for col in columns
+    }
+
+
+def _read_table(csv_file: str, columns: List[str]):
+    """Read only `columns` from the dataset into an Arrow table."""
+    if _is_parquet(csv_file):
+        return pq.read_table(csv_file, columns=columns)
+    # Pin types so empty metric columns (or a header-only file) still read as float64
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types=_column_types(columns)
+    )
+    return pa_csv.read_csv(csv_file, convert_options=convert_options)
+
+
+def _batch_to_pandas(batch) -> pd.DataFrame:
+    """Convert a record batch, keeping string columns Arrow-backed for native kernels."""
+    return batch.to_pandas(
+        split_blocks=True,
+        self_destruct=True,
+        types_mapper={pa.string(): pd.ArrowDtype(pa.string())}.get
+    )
+
+
+def _value_counts(series: pd.Series) -> Dict[Any, int]:
+    """Count non-null values, using the Arrow kernel when the column is Arrow-backed."""
+    if isinstance(series.dtype, pd.ArrowDtype):
+        counts = pc.value_counts(pa.array(series.array)).flatten()
+        return {
+            value: count
+            for value, count in zip(counts[0].to_pylist(), counts[1].to_pylist())
+            if value is not None
+        }
+    return series.value_counts().to_dict()
+
+
+def _iter_chunks(csv_file: str, columns: List[str], chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """Yield the projected columns of the dataset as DataFrame chunks."""
+    if pa is None:
+        yield from pd.read_csv(csv_file, usecols=columns, chunksize=chunk_rows)
+        return
+    
+    if _is_parquet(csv_file):
+        for batch in pq.ParquetFile(csv_file).iter_batches(batch_size=chunk_rows, columns=columns):
+            yield _batch_to_pandas(batch)
+        return
+    
+    # The streaming reader fixes column types after the first block, so pin them
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types=_column_types(columns),
+        strings_can_be_null=True
+    )
+    with pa_csv.open_csv(csv_file, convert_options=convert_options) as reader:
+        for batch in reader:
+            yield _batch_to_pandas(batch)
+
+
+def _merge_moments(acc: Tuple[int, float, float], count: int, mean: float, var: float) -> Tuple[int, float, float]:
+    """Fold a chunk's (count, mean, sample variance) into running (count, mean, M2) moments."""
+    if count == 0:
+        return acc
+    m2 = var * (count - 1) if count > 1 else 0.0
+    
+    # Chan et al. pairwise update
+    n_a, mean_a, m2_a = acc
+    n = n_a + count
+    delta = mean - mean_a
+    return n, mean_a + delta * count / n, m2_a + m2 + delta * delta * n_a * count / n
+
+
+def _extreme_row(chunk: pd.DataFrame, metric: str, extra: str, pick) -> Optional[Tuple[Any, Any, Any]]:
+    """Return (value, benchmark, extra) at the row `pick` selects, reading scalars only."""
+    values = chunk[metric].to_numpy(dtype=float, na_value=np.nan)
+    if np.isnan(values).all():
+        return None
+    i = int(pick(values))
+    extra_value = chunk[extra].iat[i] if extra in chunk.columns else None
+    bench = chunk['benchmark'].iat[i] if 'benchmark' in chunk.columns else None
+    return values[i], bench, extra_value
+
+
+def _summarize_chunks(
+    csv_file: str,
+    columns: List[str],
+    param_cols: List[str],
+    metric_cols: List[str]
+) -> Dict[str, Any]:
+    """Reduce the dataset chunk by chunk into the figures analyze_dataset reports."""
+    
+    # Running accumulators, so only one chunk is ever held in memory
+    total_rows = 0
+    ts_min = ts_max = None
+    benchmark_counts: Counter = Counter()
+    param_values = {col: set() for col in param_cols}
+    moments = {col: (0, 0.0, 0.0) for col in metric_cols}
+    best_ipc = best_cache = None
+    missing_cells = 0
+    duration_sum = 0.0
+    duration_count = 0
+    
+    for chunk in _iter_chunks(csv_file, columns):
+        total_rows += len(chunk)
+        missing_cells += int(chunk.isna().to_numpy().sum())
+        
+        if 'timestamp' in chunk.columns:
+            timestamps = chunk['timestamp'].dropna()
+            if len(timestamps):
+                lo, hi = timestamps.min(), timestamps.max()
+                ts_min = lo if ts_min is None else min(ts_min, lo)
+                ts_max = hi if ts_max is None else max(ts_max, hi)
+        
+        if 'benchmark' in chunk.columns:
+            benchmark_counts.update(_value_counts(chunk['benchmark']))
+        
+        for col in param_cols:
+            param_values[col].update(chunk[col].dropna().unique())
+        
+        if metric_cols:
+            # One vectorized pass for every metric column in the chunk
+            stats = chunk[metric_cols].agg(['count', 'mean', 'var']).to_dict()
+            for col in metric_cols:
+                col_stats = stats[col]
+                moments[col] = _merge_moments(
+                    moments[col], int(col_stats['count']), col_stats['mean'], col_stats['var']
+                )
+        
+        if 'metric_ipc' in chunk.columns:
+            candidate = _extreme_row(chunk, 'metric_ipc', 'param_cpu.cpu_type', np.nanargmax)
+            if candidate is not None and (best_ipc is None or candidate[0] > best_ipc[0]):
+                best_ipc = candidate
+        
+        if 'metric_l1d_miss_rate' in chunk.columns:
+            candidate = _extreme_row(chunk, 'metric_l1d_miss_rate', 'param_cache_l1d.size', np.nanargmin)
+            if candidate is not None and (best_cache is None or candidate[0] < best_cache[0]):
+                best_cache = candidate
+        
+        if 'duration' in chunk.columns:
+            duration_sum += float(chunk['duration'].sum())
+            duration_count += int(chunk['duration'].count())
+    
+    metric_stats = {}
+    for col, (n, mean_val, m2) in moments.items():
+        metric_stats[col] = (
+            mean_val if n > 0 else float('nan'),
+            math.sqrt(m2 / (n - 1)) if n > 1 else float('nan')
+        )
+    
+    return {
+        'rows': total_rows,
+        'ts_range': (ts_min, ts_max),
+        'benchmark_counts': benchmark_counts.most_common(),
+        'param_nunique': {col: len(values) for col, values in param_values.items()},
+        'metric_stats': metric_stats,
+        'best_ipc': best_ipc,
+        'best_cache': best_cache,
+        'missing_cells': missing_cells,
+        'duration': (duration_sum, duration_count),
+    }
+
+
+def _scan_polars(csv_file: str, columns: List[str]):
+    """Lazily scan the projected columns with explicit dtypes."""
+    if _is_parquet(csv_file):
+        return pl.scan_parquet(csv_file).select(columns)
+    schema = {
+        col: pl.Utf8 if col in ('timestamp', 'benchmark') or col.startswith('param_') else pl.Float64
+        for col in columns
+    }
+    return pl.scan_csv(csv_file, schema_overrides=schema).select(columns)
+
+
+def _summarize_polars(
+    csv_file: str,
+    columns: List[str],
+    param_cols: List[str],
+    metric_cols: List[str]
+) -> Dict[str, Any]:
+    """Compute the analyze_dataset figures with one lazy Polars query."""
+    lf = _scan_polars(csv_file, columns)
+    
+    exprs = [pl.len().alias('__rows')]
+    exprs += [pl.col(c).null_count().alias(f'__null_{c}') for c in columns]
+    exprs += [pl.col(c).drop_nulls().n_unique().alias(f'__nunique_{c}') for c in param_cols]
+    exprs += [pl.col(c).mean().alias(f'__mean_{c}') for c in metric_cols]
+    exprs += [pl.col(c).std().alias(f'__std_{c}') for c in metric_cols]
+    if 'timestamp' in columns:
+        exprs += [pl.col('timestamp').min().alias('__ts_min'), pl.col('timestamp').max().alias('__ts_max')]
+    if 'duration' in columns:
+        exprs += [pl.col('duration').sum().alias('__dur_sum'), pl.col('duration').count().alias('__dur_count')]
+    
+    def best_row(metric: str, extra: str, pick) -> List[pl.Expr]:
+        at = pick(pl.col(metric))
+        row = [pl.col(metric).get(at).alias(f'__{metric}_value')]
+        if 'benchmark' in columns:
+            row.append(pl.col('benchmark').get(at).alias(f'__{metric}_bench'))
+        if extra in columns:
+            row.append(pl.col(extra).get(at).alias(f'__{metric}_extra'))
+        return row
+    
+    if 'metric_ipc' in columns:
+        exprs += best_row('metric_ipc', 'param_cpu.cpu_type', pl.Expr.arg_max)
+    if 'metric_l1d_miss_rate' in columns:
+        exprs += best_row('metric_l1d_miss_rate', 'param_cache_l1d.size', pl.Expr.arg_min)
+    
+    queries = [lf.select(exprs)]
+    if 'benchmark' in columns:
+        queries.append(
+            lf.group_by('benchmark', maintain_order=True).len()
+            .drop_nulls('benchmark')
+            .sort('len', descending=True, maintain_order=True)
+        )
+    agg, *counts = pl.collect_all(queries)
+    agg = agg.row(0, named=True)
+    
+    def best(metric: str):
+        value = agg.get(f'__{metric}_value')
+        if value is None:
+            return None
+        return value, agg.get(f'__{metric}_bench'), agg.get(f'__{metric}_extra')
+    
+    nan = float('nan')
+    return {
+        'rows': agg['__rows'],
+        'ts_range': (agg.get('__ts_min'), agg.get('__ts_max')),
+        'benchmark_counts': list(counts[0].iter_rows()) if counts else [],
+        'param_nunique': {c: agg[f'__nunique_{c}'] for c in param_cols},
+        'metric_stats': {
+            c: tuple(nan if v is None else v for v in (agg[f'__mean_{c}'], agg[f'__std_{c}']))
+            for c in metric_cols
+        },
+        'best_ipc': best('metric_ipc'),
+        'best_cache': best('metric_l1d_miss_rate'),
+        'missing_cells': sum(agg[f'__null_{c}'] for c in columns),
+        'duration': (agg.get('__dur_sum') or 0.0, agg.get('__dur_count') or 0),
+    }
+
+
+def _count_nulls(csv_file: str, columns: List[str]) -> int:
+    """Count missing cells in columns the summary doesn't read (e.g. run_id)."""
+    if not columns:
+        return 0
+    
+    if pl is not None:
+        if _is_parquet(csv_file):
+            lf = pl.scan_parquet(csv_file)
+        else:
+            lf = pl.scan_csv(csv_file, infer_schema=False)
+        return int(sum(lf.select([pl.col(c).null_count() for c in columns]).collect().row(0)))
+    
+    if pa is not None:
+        if _is_parquet(csv_file):
+            table = pq.read_table(csv_file, columns=columns)
+        else:
+            convert_options = pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types={col: pa.string() for col in columns},
+                strings_can_be_null=True
+            )
+            table = pa_csv.read_csv(csv_file, convert_options=convert_options)
+        return sum(table.column(c).null_count for c in columns)
+    
+    return sum(
+        int(chunk.isna().to_numpy().sum())
+        for chunk in pd.read_csv(csv_file, usecols=columns, chunksize=CHUNK_ROWS)
+    )
+
 
 def analyze_dataset(csv_file: str = 'results/dataset.csv'):
     """Analyze the collected simulation dataset."""
@@ -16,8 +345,19 @@ def analyze_dataset(csv_file: str = 'results/dataset.csv'):
         print("Run simulations first: python -m scripts.simulation_runner --sweep")
         return
     
-    # Load data
-    df = pd.read_csv(csv_file)
+    if _is_parquet(csv_file) and pa is None:
+        print(f"❌ pyarrow is required to read {csv_file}")
+        return
+    
+    all_columns = _read_header(csv_file)
+    columns = _needed_columns(all_columns)
+    param_cols, metric_cols = _split_columns(columns)
+    
+    if pl is not None:
+        summary = _summarize_polars(csv_file, columns, param_cols, metric_cols)
+    else:
+        summary = _summarize_chunks(csv_file, columns, param_cols, metric_cols)
+    total_rows = summary['rows']
     
     print("\n" + "="*60)
     print("SIMULATION DATASET ANALYSIS")
@@ -25,118 +365,219 @@ def analyze_dataset(csv_file: str = 'results/dataset.csv'):
     
     # Basic statistics
     print(f"\n📊 Dataset Overview:")
-    print(f"   Total simulations: {len(df)}")
-    print(f"   Successful runs: {len(df)}")
-    print(f"   Date range: {df['timestamp'].min()} to {df['timestamp'].max()}")
+    print(f"   Total simulations: {total_rows}")
+    print(f"   Successful runs: {total_rows}")
+    print(f"   Date range: {summary['ts_range'][0]} to {summary['ts_range'][1]}")
     
     # Benchmarks
     print(f"\n🎯 Benchmarks:")
-    benchmark_counts = df['benchmark'].value_counts()
-    for bench, count in benchmark_counts.items():
+    for bench, count in summary['benchmark_counts']:
         print(f"   {bench:20s}: {count:4d} configurations")
     
     # Parameters tested
-    param_cols = [c for c in df.columns if c.startswith('param_')]
     print(f"\n⚙️  Parameters ({len(param_cols)} total):")
     for col in param_cols:
-        unique_vals = df[col].nunique()
+        unique_vals = summary['param_nunique'][col]
         print(f"   {col:40s}: {unique_vals:3d} unique values")
     
     # Metrics collected
-    metric_cols = [c for c in df.columns if c.startswith('metric_')]
     print(f"\n📈 Metrics ({len(metric_cols)} total):")
     for col in metric_cols:
         metric_name = col.replace('metric_', '')
-        mean_val = df[col].mean()
-        std_val = df[col].std()
+        mean_val, std_val = summary['metric_stats'][col]
         print(f"   {metric_name:30s}: mean={mean_val:.4f}, std={std_val:.4f}")
     
     # Performance insights
     print(f"\n🚀 Performance Insights:")
     
     # Best IPC
-    if 'metric_ipc' in df.columns:
-        best_ipc = df.loc[df['metric_ipc'].idxmax()]
-        print(f"   Best IPC: {best_ipc['metric_ipc']:.4f}")
-        print(f"     Benchmark: {best_ipc['benchmark']}")
-        if 'param_cpu.cpu_type' in df.columns:
-            print(f"     CPU Type: {best_ipc['param_cpu.cpu_type']}")
+    best_ipc = summary['best_ipc']
+    if best_ipc is not None:
+        print(f"   Best IPC: {best_ipc[0]:.4f}")
+        print(f"     Benchmark: {best_ipc[1]}")
+        if 'param_cpu.cpu_type' in columns:
+            print(f"     CPU Type: {best_ipc[2]}")
     
     # Lowest cache miss rate
-    if 'metric_l1d_miss_rate' in df.columns:
-        best_cache = df.loc[df['metric_l1d_miss_rate'].idxmin()]
-        print(f"\n   Lowest L1D miss rate: {best_cache['metric_l1d_miss_rate']:.4f}")
-        print(f"     Benchmark: {best_cache['benchmark']}")
-        if 'param_cache_l1d.size' in df.columns:
-            print(f"     L1D Size: {best_cache['param_cache_l1d.size']}")
+    best_cache = summary['best_cache']
+    if best_cache is not None:
+        print(f"\n   Lowest L1D miss rate: {best_cache[0]:.4f}")
+        print(f"     Benchmark: {best_cache[1]}")
+        if 'param_cache_l1d.size' in columns:
+            print(f"     L1D Size: {best_cache[2]}")
     
     # Data completeness
     print(f"\n✅ Data Completeness:")
-    total_cells = len(df) * len(df.columns)
-    missing_cells = df.isnull().sum().sum()
-    completeness = 100 * (1 - missing_cells / total_cells)
+    # Completeness covers every column, not just the ones summarized above
+    unread_columns = [c for c in all_columns if c not in columns]
+    missing_cells = summary['missing_cells'] + _count_nulls(csv_file, unread_columns)
+    total_cells = total_rows * len(all_columns)
+    completeness = 100 * (1 - missing_cells / total_cells) if total_cells else 0.0
     print(f"   {completeness:.2f}% complete ({missing_cells} missing values)")
     
     # Simulation time
-    if 'duration' in df.columns:
-        total_time = df['duration'].sum()
-        avg_time = df['duration'].mean()
+    if 'duration' in columns:
+        duration_sum, duration_count = summary['duration']
+        avg_time = duration_sum / duration_count if duration_count else float('nan')
         print(f"\n⏱️  Simulation Time:")
-        print(f"   Total: {total_time/3600:.2f} hours")
+        print(f"   Total: {duration_sum/3600:.2f} hours")
         print(f"   Average per run: {avg_time/60:.2f} minutes")
     
     # Storage
     file_size = Path(csv_file).stat().st_size
     print(f"\n💾 Storage:")
-    print(f"   CSV file: {file_size / (1024*1024):.2f} MB")
+    file_kind = 'Parquet' if _is_parquet(csv_file) else 'CSV'
+    print(f"   {file_kind} file: {file_size / (1024*1024):.2f} MB")
     
     print("\n" + "="*60)
     print(f"✅ Dataset ready for ML training!")
     print(f"   Features (X): {len(param_cols)} parameters")
     print(f"   Targets (y): {len(metric_cols)} metrics")
-    print(f"   Samples (n): {len(df)} configurations")
+    print(f"   Samples (n): {total_rows} configurations")
     print("="*60 + "\n")
 
 
+def _describe_table(table, metric_cols: List[str]) -> pd.DataFrame:
+    """Compute the equivalent of DataFrame.describe() with Arrow compute kernels."""
+    rows = {name: {} for name in ('count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max')}
+    for col in metric_cols:
+        values = table[col]
+        min_max = pc.min_max(values)
+        # Quantiles of a column with no values are undefined; report them as NaN
+        quartiles = (
+            pc.quantile(values, q=[0.25, 0.5, 0.75]).to_pylist()
+            if values.null_count < len(values) else []
+        )
+        rows['count'][col] = pc.count(values).as_py()
+        rows['mean'][col] = pc.mean(values).as_py()
+        rows['std'][col] = pc.stddev(values, ddof=1).as_py()
+        rows['min'][col] = min_max['min'].as_py()
+        rows['25%'][col], rows['50%'][col], rows['75%'][col] = (quartiles + [None] * 3)[:3]
+        rows['max'][col] = min_max['max'].as_py()
+    # Only the tiny stats grid is handed to pandas, for formatting
+    return pd.DataFrame.from_dict(rows, orient='index', columns=metric_cols, dtype=float)
+
+
 def export_summary(csv_file: str = 'results/dataset.csv', output: str = 'results/summary.txt'):
     """Export summary statistics to file."""
     
     if not Path(csv_file).exists():
         return
     
-    df = pd.read_csv(csv_file)
+    if _is_parquet(csv_file) and pa is None:
+        print(f"❌ pyarrow is required to read {csv_file}")
+        return
+    
+    all_columns = _read_header(csv_file)
+    param_cols, metric_cols = _split_columns(all_columns)
+    
+    if pl is not None:
+        lf = _scan_polars(csv_file, ['benchmark'] + metric_cols)
+        stats_lf = lf.select(
+            [pl.len().alias('__rows')] + [
+                getattr(pl.col(c), stat)().alias(f'{stat}|{c}')
+                for c in metric_cols for stat in ('count', 'mean', 'std', 'min', 'max')
+            ] + [
+                pl.col(c).quantile(q, interpolation='linear').alias(f'{q}|{c}')
+                for c in metric_cols for q in (0.25, 0.5, 0.75)
+            ]
+        )
+        counts_lf = (
+            lf.group_by('benchmark', maintain_order=True).len()
+            .drop_nulls('benchmark')
+            .sort('len', descending=True, maintain_order=True)
+        )
+        stats, counts = pl.collect_all([stats_lf, counts_lf])
+        stats = stats.row(0, named=True)
+        total = stats['__rows']
+        labels = (('count', 'count'), ('mean', 'mean'), ('std', 'std'), ('min', 'min'),
+                  ('25%', 0.25), ('50%', 0.5), ('75%', 0.75), ('max', 'max'))
+        summary = pd.DataFrame.from_dict(
+            {label: {c: stats[f'{key}|{c}'] for c in metric_cols} for label, key in labels},
+            orient='index', columns=metric_cols, dtype=float
+        )
+        benchmark_counts = pd.Series(
+            counts['len'].to_list(),
+            index=pd.Index(counts['benchmark'].to_list(), name='benchmark'),
+            name='count'
+        )
+    elif pa is None:
+        df = pd.read_csv(csv_file, usecols=['benchmark'] + metric_cols)
+        total = len(df)
+        summary = df[metric_cols].describe()
+        benchmark_counts = df['benchmark'].value_counts()
+    else:
+        table = _read_table(csv_file, ['benchmark'] + metric_cols)
+        total = table.num_rows
+        summary = _describe_table(table, metric_cols)
+        counts = pc.value_counts(table['benchmark']).flatten()
+        benchmark_counts = pd.Series(
+            counts[1].to_pylist(),
+            index=pd.Index(counts[0].to_pylist(), name='benchmark'),
+            name='count'
+        ).sort_values(ascending=False, kind='stable')
     
     with open(output, 'w') as f:
         f.write("SIMULATION DATASET SUMMARY\n")
         f.write("="*60 + "\n\n")
         
-        f.write(f"Total simulations: {len(df)}\n")
-        f.write(f"Benchmarks: {df['benchmark'].nunique()}\n")
-        f.write(f"Parameters: {len([c for c in df.columns if c.startswith('param_')])}\n")
-        f.write(f"Metrics: {len([c for c in df.columns if c.startswith('metric_')])}\n\n")
+        f.write(f"Total simulations: {total}\n")
+        f.write(f"Benchmarks: {len(benchmark_counts)}\n")
+        f.write(f"Parameters: {len(param_cols)}\n")
+        f.write(f"Metrics: {len(metric_cols)}\n\n")
         
         # Statistical summary
         f.write("METRIC STATISTICS\n")
         f.write("-"*60 + "\n")
-        metric_cols = [c for c in df.columns if c.startswith('metric_')]
-        summary = df[metric_cols].describe()
         f.write(summary.to_string())
         f.write("\n\n")
         
         # Benchmark breakdown
         f.write("BENCHMARK BREAKDOWN\n")
         f.write("-"*60 + "\n")
-        f.write(df['benchmark'].value_counts().to_string())
+        f.write(benchmark_counts.to_string())
         f.write("\n")
     
     print(f"✅ Summary exported to: {output}")
 
 
+def export_parquet(csv_file: str = 'results/dataset.csv', output: str = 'results/dataset_analysis.parquet'):
+    """
+    Convert the CSV dataset to a zstd-compressed, dictionary-encoded Parquet file.
+    
+    Columns use the analysis types (strings for params), so the default output is
+    kept apart from the runner's dataset.parquet (output.formats).
+    """
+    
+    if not Path(csv_file).exists():
+        return
+    
+    if pa is None:
+        print("❌ pyarrow is required for Parquet export")
+        return
+    
+    # Use the same column types the analysis reads with
+    convert_options = pa_csv.ConvertOptions(
+        column_types=_column_types(_needed_columns(_read_header(csv_file))),
+        strings_can_be_null=True
+    )
+    table = pa_csv.read_csv(csv_file, convert_options=convert_options)
+    pq.write_table(table, output, compression='zstd', use_dictionary=True)
+    
+    print(f"✅ Parquet dataset exported to: {output}")
+
+
 if __name__ == "__main__":
-    dataset_file = 'results/dataset.csv'
+    parser = argparse.ArgumentParser(description='Analyze the simulation dataset')
+    parser.add_argument('dataset', nargs='?', default='results/dataset.csv',
+                        help='Dataset to analyze (CSV, or a Parquet copy)')
+    parser.add_argument('--export-parquet', metavar='PATH',
+                        help='Also convert the CSV dataset to Parquet at PATH')
+    args = parser.parse_args()
     
-    if len(sys.argv) > 1:
-        dataset_file = sys.argv[1]
+    # Analysis is read-only; a Parquet copy is only written when asked for
+    if args.export_parquet:
+        export_parquet(args.dataset, args.export_parquet)
     
-    analyze_dataset(dataset_file)
-    export_summary(dataset_file)
+    analyze_dataset(args.dataset)
+    export_summary(args.dataset)
@@ -5,13 +5,67 @@ Handles parameter space generation and iteration
 """
 
 import json
-import itertools
+import hashlib
+import functools
 from pathlib import Path
-from typing import Dict, List, Any, Iterator, Optional
+from typing import Dict, List, Any, Iterable, Iterator, Optional
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Map config keys to gem5 argument names
+GEM5_ARG_MAPPING: Dict[str, str] = {
+    'cpu.cpu_type': '--cpu-type',
+    'cpu.cpu_clock': '--cpu-clock',
+    'memory.mem_size': '--mem-size',
+    'memory.mem_type': '--mem-type',
+    'cache_l1d.size': '--l1d_size',
+    'cache_l1d.assoc': '--l1d_assoc',
+    'cache_l1i.size': '--l1i_size',
+    'cache_l1i.assoc': '--l1i_assoc',
+    'cache_l2.size': '--l2_size',
+    'cache_l2.assoc': '--l2_assoc',
+    'cache_l3.size': '--l3_size',
+    'cache_l3.assoc': '--l3_assoc',
+    'system.sys_clock': '--sys-clock',
+    'simulation.fast_forward': '--fast-forward',
+    'simulation.max_insts': '--maxinsts',
+}
+
+# Canonical (key-sorted) JSON encoder for config IDs, built once rather than per call
+_CONFIG_ID_ENCODER = json.JSONEncoder(sort_keys=True)
+
+# Grid configurations decoded per vectorized block
+GRID_BLOCK_ROWS = 4096
+
+# Boolean config keys that switch on extra gem5 flags when true
+GEM5_ENABLE_FLAGS: Dict[str, tuple] = {
+    'cache_l2.enabled': ('--caches', '--l2cache'),
+    'cache_l3.enabled': ('--l3cache',),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_space_cached(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config space file; keyed on mtime so edits invalidate the cache."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _render_arg(key: str, value: Any) -> tuple:
+    """Render one config entry as its gem5 command-line arguments."""
+    flag = GEM5_ARG_MAPPING.get(key)
+    if flag is not None:
+        return (flag, str(value))
+    
+    # Special handling for cache enables
+    if value and key in GEM5_ENABLE_FLAGS:
+        return GEM5_ENABLE_FLAGS[key]
+    
+    return ()
+
 
 class ConfigurationManager:
     """Manage simulation configuration space and generate parameter combinations."""
@@ -26,17 +80,18 @@ class ConfigurationManager:
         self.config_space_file = config_space_file
         self.config_space = self._load_config_space()
         self.presets = self.config_space.get('presets', {})
+        self._param_space_cache: Dict[Optional[str], Dict[str, tuple]] = {}
     
     def _load_config_space(self) -> Dict[str, Any]:
         """Load configuration space from JSON file."""
         try:
-            with open(self.config_space_file, 'r') as f:
-                return json.load(f)
+            path = Path(self.config_space_file)
+            return _load_config_space_cached(path, path.stat().st_mtime_ns)
         except Exception as e:
             logger.error(f"Failed to load config space: {e}")
             return {}
     
-    def get_parameter_space(self, preset: Optional[str] = None) -> Dict[str, List[Any]]:
+    def get_parameter_space(self, preset: Optional[str] = None) -> Dict[str, tuple]:
         """
         Get the parameter space, optionally filtered by preset.
         
@@ -44,8 +99,19 @@ class ConfigurationManager:
             preset: Name of preset configuration to use
             
         Returns:
-            Dictionary mapping parameter names to possible values
+            Dictionary mapping parameter names to a tuple of possible values
         """
+        cached = self._param_space_cache.get(preset)
+        if cached is None:
+            # Freeze value lists once so samplers index immutable tuples
+            cached = self._param_space_cache[preset] = {
+                name: tuple(values)
+                for name, values in self._build_parameter_space(preset).items()
+            }
+        return dict(cached)
+    
+    def _build_parameter_space(self, preset: Optional[str]) -> Dict[str, List[Any]]:
+        """Walk the config space and apply preset overrides."""
         param_space = {}
         
         # Extract base parameters
@@ -120,9 +186,18 @@ class ConfigurationManager:
         
         logger.info(f"Generating {total_configs} configurations (grid sampling)")
         
-        for combo in itertools.product(*param_values):
-            config = dict(zip(param_names, combo))
-            yield config
+        if not param_names:
+            yield {}
+            return
+        
+        # Decode flat indices a block at a time (C order matches itertools.product),
+        # so taking the first configuration doesn't expand the whole grid
+        shape = tuple(len(values) for values in param_values)
+        for start in range(0, total_configs, GRID_BLOCK_ROWS):
+            flat = np.arange(start, min(start + GRID_BLOCK_ROWS, total_configs))
+            block = np.stack(np.unravel_index(flat, shape), axis=-1)
+            for row in block.tolist():
+                yield {name: values[i] for name, values, i in zip(param_names, param_values, row)}
     
     def _random_sampling(
         self,
@@ -141,20 +216,16 @@ class ConfigurationManager:
         Yields:
             Configuration dictionaries
         """
-        import random
-        
-        if seed is not None:
-            random.seed(seed)
-        
         logger.info(f"Generating {num_samples} configurations (random sampling)")
         
         param_names = sorted(param_space.keys())
+        lens = np.array([len(param_space[name]) for name in param_names], dtype=np.int64)
+        
+        # Draw the whole (num_samples, n_params) index matrix at once
+        rng = np.random.default_rng(seed)
+        idx = rng.integers(0, lens, size=(num_samples, len(param_names)))
         
-        for _ in range(num_samples):
-            config = {}
-            for name in param_names:
-                config[name] = random.choice(param_space[name])
-            yield config
+        yield from self._configs_from_indices(param_space, param_names, idx)
     
     def _lhs_sampling(
         self,
@@ -175,34 +246,53 @@ class ConfigurationManager:
         """
         try:
             from scipy.stats import qmc
-            import numpy as np
-            
-            if seed is not None:
-                np.random.seed(seed)
-            
-            logger.info(f"Generating {num_samples} configurations (LHS)")
-            
-            param_names = sorted(param_space.keys())
-            n_params = len(param_names)
-            
-            # Generate LHS samples in [0, 1]^n
-            sampler = qmc.LatinHypercube(d=n_params, seed=seed)
-            samples = sampler.random(n=num_samples)
-            
-            # Map samples to parameter values
-            for sample in samples:
-                config = {}
-                for i, name in enumerate(param_names):
-                    values = param_space[name]
-                    # Map [0, 1] to index in values list
-                    idx = int(sample[i] * len(values))
-                    idx = min(idx, len(values) - 1)  # Clamp to valid range
-                    config[name] = values[idx]
-                yield config
-        
         except ImportError:
             logger.warning("scipy not available, falling back to random sampling")
             yield from self._random_sampling(param_space, num_samples, seed)
+            return
+        
+        logger.info(f"Generating {num_samples} configurations (LHS)")
+        
+        param_names = sorted(param_space.keys())
+        lens = np.array([len(param_space[name]) for name in param_names], dtype=np.int64)
+        
+        # Generate LHS samples in [0, 1]^n
+        sampler = qmc.LatinHypercube(d=len(param_names), seed=seed)
+        samples = sampler.random(n=num_samples)
+        
+        # Map [0, 1] to indices into each values list, clamped to the valid range
+        idx = np.minimum((samples * lens).astype(np.int64), lens - 1)
+        
+        yield from self._configs_from_indices(param_space, param_names, idx)
+    
+    def _configs_from_indices(
+        self,
+        param_space: Dict[str, List[Any]],
+        param_names: List[str],
+        idx: np.ndarray
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Turn an (n_samples, n_params) index matrix into configuration dicts.
+        
+        Args:
+            param_space: Parameter space dictionary
+            param_names: Parameter names, in column order of idx
+            idx: Integer index matrix into each parameter's values
+            
+        Yields:
+            Configuration dictionaries
+        """
+        if not param_names:
+            for _ in range(len(idx)):
+                yield {}
+            return
+        
+        columns = []
+        for j, name in enumerate(param_names):
+            values = param_space[name]
+            columns.append([values[i] for i in idx[:, j].tolist()])
+        for row in zip(*columns):
+            yield dict(zip(param_names, row))
     
     def _custom_sampling(self) -> Iterator[Dict[str, Any]]:
         """
@@ -239,41 +329,46 @@ class ConfigurationManager:
         Returns:
             List of command-line argument strings
         """
-        args = []
-        
-        # Map config keys to gem5 argument names
-        arg_mapping = {
-            'cpu.cpu_type': '--cpu-type',
-            'cpu.cpu_clock': '--cpu-clock',
-            'memory.mem_size': '--mem-size',
-            'memory.mem_type': '--mem-type',
-            'cache_l1d.size': '--l1d_size',
-            'cache_l1d.assoc': '--l1d_assoc',
-            'cache_l1i.size': '--l1i_size',
-            'cache_l1i.assoc': '--l1i_assoc',
-            'cache_l2.size': '--l2_size',
-            'cache_l2.assoc': '--l2_assoc',
-            'cache_l3.size': '--l3_size',
-            'cache_l3.assoc': '--l3_assoc',
-            'system.sys_clock': '--sys-clock',
-            'simulation.fast_forward': '--fast-forward',
-            'simulation.max_insts': '--maxinsts',
-        }
+        args: List[str] = []
+        extend = args.extend
         
         for key, value in config.items():
-            if key in arg_mapping:
-                args.append(arg_mapping[key])
-                args.append(str(value))
-            
-            # Special handling for cache enables
-            elif key == 'cache_l2.enabled' and value:
-                args.append('--caches')
-                args.append('--l2cache')
-            elif key == 'cache_l3.enabled' and value:
-                args.append('--l3cache')
+            extend(_render_arg(key, value))
         
         return args
     
+    def config_to_gem5_args_batch(self, configs: Iterable[Dict[str, Any]]) -> List[List[str]]:
+        """
+        Convert many configurations to gem5 arguments in one pass.
+        
+        A sweep repeats the same few values per parameter, so each distinct
+        (key, value) pair is rendered once and reused across configurations.
+        
+        Args:
+            configs: Configuration dictionaries
+            
+        Returns:
+            One argument list per configuration, in input order
+        """
+        rendered: Dict[tuple, tuple] = {}
+        batch: List[List[str]] = []
+        
+        for config in configs:
+            args: List[str] = []
+            for key, value in config.items():
+                # Include the type so True/1 and 1/1.0 render separately
+                cache_key = (key, type(value), value)
+                try:
+                    parts = rendered[cache_key]
+                except KeyError:
+                    parts = rendered[cache_key] = _render_arg(key, value)
+                except TypeError:  # unhashable value
+                    parts = _render_arg(key, value)
+                args.extend(parts)
+            batch.append(args)
+        
+        return batch
+    
     def get_config_id(self, config: Dict[str, Any]) -> str:
         """
         Generate unique identifier for a configuration.
@@ -284,11 +379,10 @@ class ConfigurationManager:
         Returns:
             Configuration ID string
         """
-        # Create deterministic hash from config
-        import hashlib
-        
-        config_str = json.dumps(config, sort_keys=True)
-        config_hash = hashlib.md5(config_str.encode()).hexdigest()[:8]
+        # Create deterministic hash from config. The digest is part of every
+        # run_id on disk, so the algorithm must stay fixed for resume to work.
+        config_str = _CONFIG_ID_ENCODER.encode(config)
+        config_hash = hashlib.md5(config_str.encode(), usedforsecurity=False).hexdigest()[:8]
         
         return f"config_{config_hash}"
     
@@ -6,13 +6,18 @@ Handles automated backup of simulation results to Google Drive
 
 import os
 import io
-import pickle
+import json
 import tarfile
 import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Iterator, Optional, List, Tuple
 from datetime import datetime
 
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -20,11 +25,35 @@ from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from googleapiclient.errors import HttpError
 
+try:
+    import zstandard
+except ImportError:  # zstd archives are optional; gzip is always available
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
 # Google Drive API scopes
 SCOPES = ['https://www.googleapis.com/auth/drive.file']
 
+# Concurrent uploads when mirroring a directory file-by-file
+MAX_UPLOAD_WORKERS = 8
+
+# Archives up to this size are staged in memory before upload
+ARCHIVE_SPOOL_BYTES = 64 * 1024 * 1024
+
+# Resumable upload chunk size; larger chunks mean fewer HTTPS round-trips
+UPLOAD_CHUNK_BYTES = 16 * 1024 * 1024
+
+# Files up to this size go up as a single multipart request, skipping the
+# extra round-trip needed to open a resumable upload session
+SMALL_UPLOAD_BYTES = 5 * 1024 * 1024
+
+# Archive compression formats: name -> (file suffix, MIME type)
+ARCHIVE_FORMATS = {
+    'gzip': ('.tar.gz', 'application/gzip'),
+    'zstd': ('.tar.zst', 'application/zstd'),
+}
+
 
 class GoogleDriveBackup:
     """Manage backups to Google Drive."""
@@ -33,7 +62,8 @@ class GoogleDriveBackup:
         self,
         credentials_file: str = 'credentials.json',
         token_file: str = 'token.json',
-        folder_id: Optional[str] = None
+        folder_id: Optional[str] = None,
+        max_retries: int = 3
     ):
         """
         Initialize Google Drive backup manager.
@@ -42,11 +72,15 @@ class GoogleDriveBackup:
             credentials_file: Path to OAuth credentials JSON
             token_file: Path to store/load auth token
             folder_id: Google Drive folder ID (None = root)
+            max_retries: Retries (with exponential backoff) on 429/5xx responses
         """
         self.credentials_file = credentials_file
         self.token_file = token_file
         self.folder_id = folder_id
+        self.max_retries = max_retries
         self.service = None
+        self.creds = None
+        self._thread_local = threading.local()
         self._authenticate()
     
     def _authenticate(self):
@@ -56,8 +90,8 @@ class GoogleDriveBackup:
         # Load existing token
         if os.path.exists(self.token_file):
             try:
-                with open(self.token_file, 'rb') as token:
-                    creds = pickle.load(token)
+                with open(self.token_file, 'r') as token:
+                    creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
                 logger.info("Loaded existing Google Drive credentials")
             except Exception as e:
                 logger.warning(f"Failed to load token: {e}")
@@ -87,8 +121,10 @@ class GoogleDriveBackup:
                 logger.info("Obtained new Google Drive credentials")
             
             # Save credentials
-            with open(self.token_file, 'wb') as token:
-                pickle.dump(creds, token)
+            with open(self.token_file, 'w') as token:
+                token.write(creds.to_json())
+        
+        self.creds = creds
         
         # Build service
         try:
@@ -131,11 +167,36 @@ class GoogleDriveBackup:
             logger.error(f"Failed to create folder: {error}")
             raise
     
+    def _thread_http(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return an authorized HTTP transport owned by the calling thread.
+        
+        httplib2 connections are not thread-safe, so worker threads must not
+        share the transport bound to self.service.
+        """
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
+    def _execute_upload(self, request, label: str, http: Optional[httplib2.Http] = None) -> dict:
+        """Execute an upload request, driving resumable ones chunk by chunk."""
+        if request.resumable is None:
+            return request.execute(http=http, num_retries=self.max_retries)
+        
+        response = None
+        while response is None:
+            status, response = request.next_chunk(http=http, num_retries=self.max_retries)
+            if status:
+                logger.debug(f"Uploading '{label}': {status.progress() * 100:.0f}%")
+        return response
+    
     def upload_file(
         self,
         file_path: Path,
         folder_id: Optional[str] = None,
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        http: Optional[httplib2.Http] = None
     ) -> str:
         """
         Upload a file to Google Drive.
@@ -144,6 +205,7 @@ class GoogleDriveBackup:
             file_path: Path to file to upload
             folder_id: Destination folder ID
             filename: Custom filename (default: use original)
+            http: HTTP transport to use (default: the service's own)
             
         Returns:
             Uploaded file ID
@@ -151,9 +213,35 @@ class GoogleDriveBackup:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        media = MediaFileUpload(
+            str(file_path),
+            resumable=file_path.stat().st_size > SMALL_UPLOAD_BYTES,
+            chunksize=UPLOAD_CHUNK_BYTES
+        )
+        return self._upload_media(media, filename or file_path.name, folder_id, http)
+    
+    def _upload_media(
+        self,
+        media,
+        filename: str,
+        folder_id: Optional[str] = None,
+        http: Optional[httplib2.Http] = None
+    ) -> str:
+        """
+        Create a Drive file from an upload media object.
+        
+        Args:
+            media: MediaUpload instance holding the content
+            filename: Remote filename
+            folder_id: Destination folder ID
+            http: HTTP transport to use (default: the service's own)
+            
+        Returns:
+            Uploaded file ID
+        """
         try:
             file_metadata = {
-                'name': filename or file_path.name
+                'name': filename
             }
             
             if folder_id:
@@ -161,16 +249,12 @@ class GoogleDriveBackup:
             elif self.folder_id:
                 file_metadata['parents'] = [self.folder_id]
             
-            media = MediaFileUpload(
-                str(file_path),
-                resumable=True
-            )
-            
-            file = self.service.files().create(
+            request = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
                 fields='id,name,size'
-            ).execute()
+            )
+            file = self._execute_upload(request, filename, http)
             
             file_id = file.get('id')
             file_name = file.get('name')
@@ -208,17 +292,22 @@ class GoogleDriveBackup:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         try:
-            media = MediaFileUpload(str(file_path), resumable=True)
+            media = MediaFileUpload(
+                str(file_path),
+                resumable=file_path.stat().st_size > SMALL_UPLOAD_BYTES,
+                chunksize=UPLOAD_CHUNK_BYTES
+            )
             body = {}
             if filename:
                 body['name'] = filename
             
-            file = self.service.files().update(
+            request = self.service.files().update(
                 fileId=file_id,
                 body=body or None,
                 media_body=media,
                 fields='id,name,size'
-            ).execute()
+            )
+            file = self._execute_upload(request, filename or file_path.name)
             
             logger.info(
                 f"Updated '{file.get('name')}' "
@@ -262,15 +351,20 @@ class GoogleDriveBackup:
         self,
         directory: Path,
         compress: bool = True,
-        folder_id: Optional[str] = None
+        folder_id: Optional[str] = None,
+        compression: str = 'gzip',
+        exclude: Optional[Callable[[str], bool]] = None
     ) -> str:
         """
         Upload a directory to Google Drive.
         
         Args:
             directory: Path to directory
-            compress: Compress as tar.gz before upload
+            compress: Compress as a tar archive before upload
             folder_id: Destination folder ID
+            compression: Archive compression, 'gzip' or 'zstd'
+            exclude: Called with each entry's POSIX path relative to `directory`;
+                returning True skips it (and, for a directory, everything below)
             
         Returns:
             Uploaded file/folder ID
@@ -279,35 +373,97 @@ class GoogleDriveBackup:
             raise FileNotFoundError(f"Directory not found: {directory}")
         
         if compress:
-            # Create compressed archive
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            archive_name = f"{directory.name}_{timestamp}.tar.gz"
-            archive_path = directory.parent / archive_name
+            if compression not in ARCHIVE_FORMATS:
+                raise ValueError(f"Unknown compression: {compression}")
+            if compression == 'zstd' and zstandard is None:
+                logger.warning("zstandard not installed, falling back to gzip")
+                compression = 'gzip'
+            suffix, mimetype = ARCHIVE_FORMATS[compression]
             
-            logger.info(f"Compressing directory: {directory}")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            archive_name = f"{directory.name}_{timestamp}{suffix}"
             
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(directory, arcname=directory.name)
+            logger.info(f"Compressing directory ({compression}): {directory}")
             
-            try:
-                file_id = self.upload_file(archive_path, folder_id)
-                return file_id
-            finally:
-                # Clean up archive
-                if archive_path.exists():
-                    archive_path.unlink()
+            # Stream the archive into a spooled buffer (memory first, anonymous
+            # temp file past the threshold) and upload straight from it, so no
+            # archive is ever left next to the results.
+            with tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_BYTES) as buffer:
+                if compression == 'zstd':
+                    # Multi-threaded zstd framing; level 3 is about gzip's ratio
+                    cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+                    with cctx.stream_writer(buffer, closefd=False) as zout:
+                        with tarfile.open(fileobj=zout, mode='w|') as tar:
+                            self._add_tree(tar, directory, exclude)
+                else:
+                    with tarfile.open(fileobj=buffer, mode='w|gz') as tar:
+                        self._add_tree(tar, directory, exclude)
+                buffer.seek(0)
+                
+                media = MediaIoBaseUpload(
+                    buffer,
+                    mimetype=mimetype,
+                    resumable=True,
+                    chunksize=UPLOAD_CHUNK_BYTES
+                )
+                return self._upload_media(media, archive_name, folder_id)
         else:
             # Create folder and upload contents
             folder_name = directory.name
             remote_folder_id = self.create_folder(folder_name, folder_id)
             
-            for item in directory.rglob('*'):
-                if item.is_file():
-                    relative_path = item.relative_to(directory)
-                    self.upload_file(item, remote_folder_id, str(relative_path))
+            file_list = [
+                (directory / relative_path, relative_path)
+                for relative_path, is_dir in self._walk_tree(directory, exclude)
+                if not is_dir
+            ]
+            
+            # Uploads are latency-bound HTTPS round-trips, so overlap them
+            def upload(entry):
+                item, relative_path = entry
+                return self.upload_file(item, remote_folder_id, relative_path, http=self._thread_http())
+            
+            with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor:
+                list(executor.map(upload, file_list))
             
             return remote_folder_id
     
+    @staticmethod
+    def _walk_tree(
+        directory: Path,
+        exclude: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[Tuple[str, bool]]:
+        """Yield (POSIX path relative to `directory`, is_dir) top-down, pruning excluded entries."""
+        for root, dirs, files in os.walk(directory):
+            rel_root = Path(root).relative_to(directory)
+            dirs[:] = sorted(d for d in dirs if not (exclude and exclude((rel_root / d).as_posix())))
+            for name in dirs:
+                yield (rel_root / name).as_posix(), True
+            for name in sorted(files):
+                relative_path = (rel_root / name).as_posix()
+                if not (exclude and exclude(relative_path)):
+                    yield relative_path, False
+    
+    def _add_tree(
+        self,
+        tar: tarfile.TarFile,
+        directory: Path,
+        exclude: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Add `directory` to `tar` under its own name, entry by entry.
+        
+        Entries are filtered before they are stat'ed, and files that disappear
+        while the archive is written (e.g. temp files being renamed) are skipped,
+        so archiving a live results directory doesn't abort the backup.
+        """
+        tar.add(directory, arcname=directory.name, recursive=False)
+        for relative_path, _ in self._walk_tree(directory, exclude):
+            try:
+                tar.add(directory / relative_path, arcname=f"{directory.name}/{relative_path}", recursive=False)
+            except FileNotFoundError:
+                logger.debug(f"Skipping entry removed during backup: {relative_path}")
+    
     def list_files(self, folder_id: Optional[str] = None, query: Optional[str] = None) -> List[dict]:
         """
         List files in Google Drive folder.
@@ -366,7 +522,9 @@ class GoogleDriveBackup:
         self,
         results_dir: Path,
         compress: bool = True,
-        delete_after: bool = False
+        delete_after: bool = False,
+        compression: str = 'gzip',
+        exclude: Optional[Callable[[str], bool]] = None
     ) -> Optional[str]:
         """
         Backup simulation results directory to Google Drive.
@@ -375,6 +533,8 @@ class GoogleDriveBackup:
             results_dir: Path to results directory
             compress: Compress before upload
             delete_after: Delete local copy after successful upload
+            compression: Archive compression, 'gzip' or 'zstd'
+            exclude: Predicate on paths relative to `results_dir`; see upload_directory
             
         Returns:
             File ID of uploaded backup, or None if failed
@@ -385,7 +545,9 @@ class GoogleDriveBackup:
             file_id = self.upload_directory(
                 results_dir,
                 compress=compress,
-                folder_id=self.folder_id
+                folder_id=self.folder_id,
+                compression=compression,
+                exclude=exclude
             )
             
             if delete_after and file_id:
@@ -4,114 +4,216 @@ Gem5 Stats Parser
 Extracts metrics from gem5 stats.txt output files
 """
 
-import re
+import sys
+import functools
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterable, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Read buffer for stats files; gem5 dumps commonly run to tens of MB
+READ_BUFFER_BYTES = 1024 * 1024
+
+# Characters a numeric stat value can start with
+_NUMERIC_HEAD = frozenset('0123456789+-.')
+
+# extract_key_metrics schema: (metric name, stats.txt key) copied as-is
+_DIRECT_STATS = (
+    ('sim_seconds', 'sim_seconds'),
+    ('sim_ticks', 'sim_ticks'),
+    ('sim_freq', 'sim_freq'),
+    ('sim_insts', 'sim_insts'),
+    ('sim_ops', 'sim_ops'),
+    ('host_inst_rate', 'host_inst_rate'),
+    ('host_op_rate', 'host_op_rate'),
+    ('host_seconds', 'host_seconds'),
+)
+
+# Cache levels: (metric prefix, hits key, misses key)
+_CACHE_STATS = (
+    ('l1d', 'system.cpu.dcache.overall_hits::total', 'system.cpu.dcache.overall_misses::total'),
+    ('l1i', 'system.cpu.icache.overall_hits::total', 'system.cpu.icache.overall_misses::total'),
+    ('l2', 'system.l2.overall_hits::total', 'system.l2.overall_misses::total'),
+)
+
+# Keys tried in order; the first non-zero value wins
+_CYCLES_KEYS = ('system.switch_cpus.numCycles', 'system.cpu.numCycles')
+_BRANCH_KEYS = ('system.cpu.branchPred.condPredicted', 'system.switch_cpus.branchPred.condPredicted')
+_BRANCH_MISS_KEYS = ('system.cpu.branchPred.condIncorrect', 'system.switch_cpus.branchPred.condIncorrect')
+
+_MEM_REQ_STATS = (
+    ('mem_read_reqs', 'system.mem_ctrls.readReqs'),
+    ('mem_write_reqs', 'system.mem_ctrls.writeReqs'),
+)
+
 
 class Gem5StatsParser:
     """Parse gem5 statistics files and extract relevant metrics."""
     
-    def __init__(self, metrics_config: Optional[List[str]] = None):
+    def __init__(self, metrics_config: Optional[Iterable[str]] = None):
         """
         Initialize the parser.
         
         Args:
-            metrics_config: List of metric names to extract (None = extract all)
+            metrics_config: Metric names to extract (None = extract all)
         """
-        self.metrics_config = metrics_config
+        # Hashed once so the per-line membership test is O(1)
+        self.metrics_config = frozenset(metrics_config) if metrics_config is not None else None
         self.stats = {}
     
-    def parse_file(self, stats_file: Path) -> Dict[str, Any]:
+    def parse_file(self, stats_file: Path, keep_descriptions: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Parse a gem5 stats.txt file.
         
         Args:
             stats_file: Path to stats.txt file
+            keep_descriptions: Also collect each stat's description text
             
         Returns:
-            Dictionary of metric_name: value pairs
+            Dictionary with parallel 'values' (metric_name: value) and
+            'descriptions' (metric_name: text) dictionaries
         """
-        if not stats_file.exists():
-            logger.error(f"Stats file not found: {stats_file}")
-            return {}
-        
-        stats = {}
+        values: Dict[str, Any] = {}
+        descriptions: Dict[str, str] = {}
+        stats = {'values': values, 'descriptions': descriptions}
+        metrics_config = self.metrics_config
         
         try:
-            with open(stats_file, 'r') as f:
+            with open(stats_file, 'r', buffering=READ_BUFFER_BYTES) as f:
                 for line in f:
-                    line = line.strip()
+                    # Lines are not stripped: split() already skips leading and
+                    # trailing whitespace, so only a kept description needs trimming
                     
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#') or line.startswith('-'):
-                        continue
+                    # With a whitelist, test just the leading name before tokenizing
+                    # the rest of the line; most lines are rejected here
+                    if metrics_config is not None:
+                        head = line.split(None, 1)
+                        if not head or head[0] not in metrics_config:
+                            continue
                     
                     # Parse stat line: stat_name value # description
-                    match = re.match(r'^([^\s]+)\s+([^\s#]+)(?:\s+#\s*(.*))?$', line)
-                    if match:
-                        stat_name = match.group(1)
-                        stat_value = match.group(2)
-                        stat_desc = match.group(3) if match.group(3) else ""
-                        
-                        # Filter by metrics_config if provided
-                        if self.metrics_config is None or stat_name in self.metrics_config:
-                            # Try to convert to numeric
-                            try:
-                                # Handle scientific notation
-                                if 'e' in stat_value.lower() or '.' in stat_value:
-                                    stat_value = float(stat_value)
-                                else:
-                                    stat_value = int(stat_value)
-                            except ValueError:
-                                # Keep as string if not numeric
-                                pass
-                            
-                            stats[stat_name] = {
-                                'value': stat_value,
-                                'description': stat_desc
-                            }
+                    parts = line.split(None, 2)
+                    
+                    # Skip empty, comment and separator lines
+                    if len(parts) < 2 or parts[0][0] == '#' or parts[0][0] == '-':
+                        continue
+                    if '#' in parts[1]:
+                        continue
+                    if len(parts) == 3 and parts[2][0] != '#':
+                        # Multi-column stats (histograms, vectors) carry no single value
+                        continue
+                    
+                    # Interned names share one object across files and hash once
+                    stat_name = sys.intern(parts[0])
+                    
+                    stat_value = parts[1]
+                    if keep_descriptions:
+                        descriptions[stat_name] = parts[2][1:].strip() if len(parts) == 3 else ""
+                    
+                    # Try to convert to numeric; other leading characters can't parse
+                    if stat_value[0] in _NUMERIC_HEAD:
+                        try:
+                            # Handle scientific notation
+                            if '.' in stat_value or 'e' in stat_value or 'E' in stat_value:
+                                stat_value = float(stat_value)
+                            else:
+                                stat_value = int(stat_value)
+                        except ValueError:
+                            # Keep as string if not numeric
+                            pass
+                    
+                    values[stat_name] = stat_value
+        
+        except FileNotFoundError:
+            # Opening directly saves a separate exists() probe per file
+            logger.error(f"Stats file not found: {stats_file}")
+            return stats
         
         except Exception as e:
             logger.error(f"Error parsing stats file {stats_file}: {e}")
-            return {}
+            return {'values': {}, 'descriptions': {}}
         
-        logger.info(f"Parsed {len(stats)} metrics from {stats_file}")
+        logger.info("Parsed %d metrics from %s", len(values), stats_file)
         return stats
     
-    def extract_key_metrics(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+    def parse_to_arrow(self, stats_file: Path, output: Optional[Path] = None):
+        """
+        Parse a gem5 stats.txt file into a columnar Arrow record batch.
+        
+        Args:
+            stats_file: Path to stats.txt file
+            output: Optional Parquet file to also write the batch to
+            
+        Returns:
+            pyarrow.RecordBatch with name, value and description columns;
+            value is float64 and null for non-numeric stats
+        """
+        # pyarrow is optional and slow to import; simulation_runner imports this
+        # module on every start, so only parse_to_arrow loads it
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("pyarrow is required for parse_to_arrow") from e
+        
+        stats = self.parse_file(stats_file)
+        values = stats['values']
+        descriptions = stats['descriptions']
+        
+        # Build each column as one list and convert once, not row by row
+        names = list(values)
+        numbers = [
+            float(v) if isinstance(v, (int, float)) else None
+            for v in values.values()
+        ]
+        texts = [descriptions.get(name, "") for name in names]
+        
+        schema = pa.schema([
+            ('name', pa.string()),
+            ('value', pa.float64()),
+            ('description', pa.string()),
+        ])
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(names, pa.string()), pa.array(numbers, pa.float64()), pa.array(texts, pa.string())],
+            schema=schema
+        )
+        
+        if output is not None:
+            pq.write_table(pa.Table.from_batches([batch]), output, compression='zstd')
+        
+        return batch
+    
+    def extract_key_metrics(self, stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Extract and compute key performance metrics.
         
         Args:
-            stats: Dictionary of raw statistics
+            stats: Raw statistics as returned by parse_file
             
         Returns:
             Dictionary of computed metrics
         """
         metrics = {}
+        values = stats.get('values', {})
+        get_value = values.get
         
-        # Helper to safely get stat value
-        def get_value(key: str, default=0):
-            return stats.get(key, {}).get('value', default)
-        
-        # Basic performance metrics
-        metrics['sim_seconds'] = get_value('sim_seconds')
-        metrics['sim_ticks'] = get_value('sim_ticks')
-        metrics['sim_freq'] = get_value('sim_freq')
-        metrics['sim_insts'] = get_value('sim_insts')
-        metrics['sim_ops'] = get_value('sim_ops')
+        def first_value(keys: tuple):
+            # Same semantics as chaining get_value(a) or get_value(b)
+            value = 0
+            for key in keys:
+                value = get_value(key, 0)
+                if value:
+                    break
+            return value
         
-        # Host performance
-        metrics['host_inst_rate'] = get_value('host_inst_rate')
-        metrics['host_op_rate'] = get_value('host_op_rate')
-        metrics['host_seconds'] = get_value('host_seconds')
+        # Basic performance and host metrics
+        for name, key in _DIRECT_STATS:
+            metrics[name] = get_value(key, 0)
         
         # Compute IPC (instructions per cycle)
-        num_cycles = get_value('system.switch_cpus.numCycles') or get_value('system.cpu.numCycles')
+        num_cycles = first_value(_CYCLES_KEYS)
         if num_cycles > 0 and metrics['sim_insts'] > 0:
             metrics['ipc'] = metrics['sim_insts'] / num_cycles
             metrics['cpi'] = num_cycles / metrics['sim_insts']
@@ -119,40 +221,25 @@ class Gem5StatsParser:
             metrics['ipc'] = 0
             metrics['cpi'] = 0
         
-        # Cache statistics (L1 Data)
-        l1d_hits = get_value('system.cpu.dcache.overall_hits::total')
-        l1d_misses = get_value('system.cpu.dcache.overall_misses::total')
-        l1d_accesses = l1d_hits + l1d_misses
-        metrics['l1d_miss_rate'] = (l1d_misses / l1d_accesses) if l1d_accesses > 0 else 0
-        metrics['l1d_hits'] = l1d_hits
-        metrics['l1d_misses'] = l1d_misses
-        
-        # Cache statistics (L1 Instruction)
-        l1i_hits = get_value('system.cpu.icache.overall_hits::total')
-        l1i_misses = get_value('system.cpu.icache.overall_misses::total')
-        l1i_accesses = l1i_hits + l1i_misses
-        metrics['l1i_miss_rate'] = (l1i_misses / l1i_accesses) if l1i_accesses > 0 else 0
-        metrics['l1i_hits'] = l1i_hits
-        metrics['l1i_misses'] = l1i_misses
-        
-        # Cache statistics (L2)
-        l2_hits = get_value('system.l2.overall_hits::total')
-        l2_misses = get_value('system.l2.overall_misses::total')
-        l2_accesses = l2_hits + l2_misses
-        metrics['l2_miss_rate'] = (l2_misses / l2_accesses) if l2_accesses > 0 else 0
-        metrics['l2_hits'] = l2_hits
-        metrics['l2_misses'] = l2_misses
+        # Cache statistics (L1 Data, L1 Instruction, L2)
+        for level, hits_key, misses_key in _CACHE_STATS:
+            hits = get_value(hits_key, 0)
+            misses = get_value(misses_key, 0)
+            accesses = hits + misses
+            metrics[f'{level}_miss_rate'] = (misses / accesses) if accesses > 0 else 0
+            metrics[f'{level}_hits'] = hits
+            metrics[f'{level}_misses'] = misses
         
         # Branch prediction
-        branches = get_value('system.cpu.branchPred.condPredicted') or get_value('system.switch_cpus.branchPred.condPredicted')
-        branch_misses = get_value('system.cpu.branchPred.condIncorrect') or get_value('system.switch_cpus.branchPred.condIncorrect')
+        branches = first_value(_BRANCH_KEYS)
+        branch_misses = first_value(_BRANCH_MISS_KEYS)
         metrics['branch_mispred_rate'] = (branch_misses / branches) if branches > 0 else 0
         metrics['branches'] = branches
         metrics['branch_mispredicts'] = branch_misses
         
         # Memory bandwidth
-        bytes_read = get_value('system.mem_ctrls.bytesReadSys')
-        bytes_written = get_value('system.mem_ctrls.bytesWrittenSys')
+        bytes_read = get_value('system.mem_ctrls.bytesReadSys', 0)
+        bytes_written = get_value('system.mem_ctrls.bytesWrittenSys', 0)
         if metrics['sim_seconds'] > 0:
             metrics['memory_read_bw'] = bytes_read / metrics['sim_seconds']
             metrics['memory_write_bw'] = bytes_written / metrics['sim_seconds']
@@ -163,11 +250,39 @@ class Gem5StatsParser:
             metrics['memory_total_bw'] = 0
         
         # Memory requests
-        metrics['mem_read_reqs'] = get_value('system.mem_ctrls.readReqs')
-        metrics['mem_write_reqs'] = get_value('system.mem_ctrls.writeReqs')
+        for name, key in _MEM_REQ_STATS:
+            metrics[name] = get_value(key, 0)
         
         return metrics
     
+    @classmethod
+    def parse_many(
+        cls,
+        stats_files: Iterable[Path],
+        metrics_config: Optional[Iterable[str]] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[Path, Dict[str, Any]]:
+        """
+        Parse and extract key metrics from many stats files in parallel.
+        
+        Args:
+            stats_files: Paths to stats.txt files
+            metrics_config: Metric names to extract (None = extract all)
+            max_workers: Worker processes (default: one per CPU)
+            
+        Returns:
+            Dictionary mapping each stats file to its key metrics
+        """
+        stats_files = list(stats_files)
+        if metrics_config is not None:
+            metrics_config = frozenset(metrics_config)
+        
+        # Parsing is CPU-bound, so fan out across processes rather than threads
+        worker = functools.partial(_parse_one, metrics_config=metrics_config)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(worker, stats_files, chunksize=8)
+            return dict(zip(stats_files, results))
+    
     def parse_and_extract(self, stats_file: Path) -> Dict[str, Any]:
         """
         Parse stats file and extract key metrics in one call.
@@ -178,10 +293,41 @@ class Gem5StatsParser:
         Returns:
             Dictionary of key metrics
         """
-        raw_stats = self.parse_file(stats_file)
+        try:
+            st = stats_file.stat()
+        except OSError:
+            # Let parse_file report the missing file
+            return self._parse_and_extract(stats_file)
+        
+        # Memoized per file version, so re-analysing an unchanged file skips the parse
+        metrics = _parse_and_extract_cached(
+            str(stats_file), st.st_mtime_ns, st.st_size, self.metrics_config
+        )
+        return dict(metrics)
+    
+    def _parse_and_extract(self, stats_file: Path) -> Dict[str, Any]:
+        """Uncached parse_and_extract."""
+        # Descriptions are never used for the key metrics, so skip collecting them
+        raw_stats = self.parse_file(stats_file, keep_descriptions=False)
         return self.extract_key_metrics(raw_stats)
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_and_extract_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    metrics_config: Optional[frozenset]
+) -> Dict[str, Any]:
+    """Parse a stats file once per version; mtime and size in the key invalidate rewrites."""
+    return Gem5StatsParser(metrics_config)._parse_and_extract(Path(path))
+
+
+def _parse_one(stats_file: Path, metrics_config: Optional[frozenset] = None) -> Dict[str, Any]:
+    """Process-pool entry point for Gem5StatsParser.parse_many."""
+    return Gem5StatsParser(metrics_config).parse_and_extract(stats_file)
+
+
 def parse_config_ini(config_file: Path) -> Dict[str, Any]:
     """
     Parse gem5 config.ini file to extract configuration parameters.
@@ -193,24 +339,29 @@ def parse_config_ini(config_file: Path) -> Dict[str, Any]:
         Dictionary of configuration parameters
     """
     config = {}
-    current_section = None
+    section = None
     
     try:
-        with open(config_file, 'r') as f:
+        with open(config_file, 'r', buffering=READ_BUFFER_BYTES) as f:
             for line in f:
                 line = line.strip()
+                if not line:
+                    continue
                 
                 # Section header
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                    config[current_section] = {}
+                if line[0] == '[' and line[-1] == ']':
+                    name = line[1:-1]
+                    section = config[name] = {}
+                    if not name:
+                        # Parameters under an unnamed section are dropped
+                        section = None
                 
                 # Parameter line
-                elif '=' in line and current_section:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    config[current_section][key] = value
+                elif section is not None:
+                    key, sep, value = line.partition('=')
+                    if sep:
+                        # The line is already stripped at both ends
+                        section[key.rstrip()] = value.lstrip()
     
     except Exception as e:
         logger.error(f"Error parsing config file {config_file}: {e}")
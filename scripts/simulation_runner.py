@@ -14,18 +14,29 @@ import logging
 import signal
 import argparse
 import shlex
+import time
+import functools
+import math
+import textwrap
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple, Iterator, Iterable, NamedTuple, Mapping
 import csv
+from dataclasses import dataclass, fields
+from types import MappingProxyType
 
-import pandas as pd
+# pandas (~0.4 s to import) is imported only where a DataFrame is needed,
+# so --status, --test and --help start without it
 from tqdm import tqdm
 from rich.console import Console
-from rich.table import Table
 from rich.logging import RichHandler
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; run-log events fall back to the stdlib encoder
+    orjson = None
+
 if __package__ is None or __package__ == "":
     import sys as _sys
 
@@ -146,6 +157,121 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it; same results as safe_load
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@dataclass(frozen=True)
+class BenchmarkSpec:
+    """How to launch one benchmark; relative paths are resolved against cpu2006."""
+    binary: str
+    options: Any = None  # list entries become a tuple; a plain string is passed through
+    stdin: Optional[str] = None
+    working_dir: Optional[str] = None
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+
+
+BENCHMARK_SPEC_FIELDS = frozenset(f.name for f in fields(BenchmarkSpec))
+
+
+class CmdTemplate(NamedTuple):
+    """Config-independent part of a benchmark's gem5 invocation."""
+    base_argv: Tuple[str, ...]  # everything after '-d <run_dir>': script, --cmd, --options
+    stdin_path: Optional[Path]
+    working_dir: Path
+
+
+def _maybe_path(value: str) -> bool:
+    """Cheap test for option tokens worth probing as files ('/' or a PurePath suffix)."""
+    if '/' in value:
+        return True
+    # Same rule as bool(Path(value).suffix) for a single path component
+    dot = value.rfind('.')
+    return 0 < dot < len(value) - 1
+
+
+def _physical_cpus() -> List[int]:
+    """CPUs this process may use, keeping one hyperthread per physical core."""
+    allowed = sorted(os.sched_getaffinity(0))
+    cpus: List[int] = []
+    seen_cores = set()
+    for cpu in allowed:
+        try:
+            siblings = Path(f"/sys/devices/system/cpu/cpu{cpu}/topology/thread_siblings_list").read_text().strip()
+        except OSError:
+            siblings = str(cpu)
+        if siblings not in seen_cores:
+            seen_cores.add(siblings)
+            cpus.append(cpu)
+    return cpus
+
+
+def _json_safe(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace NaN/Infinity with None, as orjson does, so stdlib output stays valid JSON."""
+    return {
+        key: None if isinstance(value, float) and not math.isfinite(value) else value
+        for key, value in record.items()
+    }
+
+
+def _json_line(record: Dict[str, Any]) -> str:
+    """Encode a record as one JSON Lines line, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(record).decode() + '\n'
+    return json.dumps(_json_safe(record), allow_nan=False) + '\n'
+
+
+def _json_array_item(record: Dict[str, Any]) -> bytes:
+    """Encode a record as an indented element of a top-level JSON array."""
+    if orjson is not None:
+        return b'  ' + orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+    return textwrap.indent(json.dumps(_json_safe(record), indent=2, allow_nan=False), '  ').encode()
+
+
+def _parse_csv_value(value: Optional[str]) -> Any:
+    """Recover the JSON type of a dataset.csv cell (empty and nan/inf cells become null)."""
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        if value in ('True', 'False'):
+            return value == 'True'
+        return value
+    # One float() attempt per cell; integers are told apart by their digits
+    if value.isdigit() or (value[0] == '-' and value[1:].isdigit()):
+        return int(value)
+    if not math.isfinite(number):
+        return None
+    return number
+
+
+def _iso_timestamp(wall_ns: int) -> str:
+    """Format a time.time_ns() value the way datetime.now().isoformat() would."""
+    seconds, nanos = divmod(wall_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
+
+# How often the parallel scheduler polls in-flight gem5 processes
+POLL_INTERVAL_SECONDS = 0.1
+
+# Read size for counting dataset.csv rows when the cached count is stale
+DATASET_COUNT_CHUNK_BYTES = 1 << 20
+
+# Arrow CSV block size for --status scans when polars is not installed
+DATASET_SCAN_BLOCK_BYTES = 4 << 20
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_under(base_dir: str, path_value: str) -> Path:
+    """Resolve path_value relative to base_dir (memoized; every run repeats the same paths)."""
+    path_obj = Path(path_value)
+    if not path_obj.is_absolute():
+        path_obj = (Path(base_dir) / path_obj).resolve()
+    else:
+        path_obj = path_obj.expanduser().resolve()
+    return path_obj
+
 
 class SimulationRunner:
     """Orchestrate gem5 simulation runs with automated data collection."""
@@ -194,25 +320,88 @@ class SimulationRunner:
                 self.gdrive_backup = GoogleDriveBackup(
                     credentials_file=self.config['google_drive']['credentials_file'],
                     token_file=self.config['google_drive']['token_file'],
-                    folder_id=self.config['google_drive'].get('folder_id')
+                    folder_id=self.config['google_drive'].get('folder_id'),
+                    max_retries=self.config['google_drive'].get('max_retries', 3)
                 )
                 logger.info("Google Drive backup enabled")
             except Exception as e:
                 logger.warning(f"Google Drive backup disabled: {e}")
         
-        # Run tracking
+        # Run tracking: run_log.jsonl is an append-only event log, run_log.json a snapshot
         self.run_log_file = self.results_dir / 'run_log.json'
+        self.run_events_file = self.results_dir / 'run_log.jsonl'
+        self._run_log_fh = None
         self.dataset_file = self.results_dir / 'dataset.csv'
+        self.dataset_jsonl_file = self.results_dir / 'dataset.jsonl'
+        self.dataset_json_file = self.results_dir / 'dataset.json'
+        self.output_formats = self.config['output'].get('formats') or ['csv', 'json']
         self.dataset_drive_id_file = self.results_dir / '.dataset_drive_id'
+        self.dataset_row_count_file = self.results_dir / '.dataset_row_count'
+        self._duration_totals: Dict[str, List[float]] = {}  # benchmark -> [seconds, runs]
         self.run_log = self._load_run_log()
+        self._completed_set = set(self.run_log['completed'])
+        self._failed_set = set(self.run_log['failed'])
         self.session_successful_runs = 0
         self.session_failed_runs = 0
         self.dataset_total_rows = self._count_existing_dataset_rows()
         self.dataset_drive_file_id = self._load_dataset_drive_file_id()
         
+        # Debounced dataset.csv uploads: sync after N new rows or T seconds
+        drive_config = self.config['google_drive']
+        self.drive_sync_every_rows = drive_config.get('sync_every_rows', 50)
+        self.drive_sync_every_seconds = drive_config.get('sync_every_seconds', 300)
+        self._rows_since_drive_sync = 0
+        self._last_drive_sync = time.monotonic()
+        self._last_synced_stat: Optional[Tuple[int, int]] = None
+        
+        # Results backups upload in the background while the next simulations run
+        self._backup_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_backup: Optional[Future] = None
+        # Run directories gem5 may still be writing; backups leave them out
+        self._active_run_ids = set()
+        
+        # Optionally pin each parallel gem5 run to its own physical core
+        self._cpu_pool: Optional[List[int]] = None
+        if self.config['simulation'].get('pin_cpus', False):
+            if hasattr(os, 'sched_setaffinity'):
+                self._cpu_pool = _physical_cpus()
+            else:
+                logger.warning("simulation.pin_cpus is not supported on this platform; ignoring")
+        
+        # gem5's stdout can be hundreds of MB; the parser only needs stats.txt
+        self.discard_stdout = self.config['simulation'].get('discard_stdout', False)
+        
+        # Append handle for dataset.csv, opened on the first appended row
+        self._dataset_fh = None
+        self._dataset_writer: Optional[csv.DictWriter] = None
+        self._dataset_jsonl_fh = None
+        
         # Validate setup
         self._validate_setup()
         self.benchmark_commands = self._load_benchmark_commands()
+        
+        # Per-benchmark command templates; only run_dir and config args vary per run
+        self._options_cache: Dict[Tuple[str, tuple], Optional[str]] = {}
+        self._cmd_templates: Dict[str, CmdTemplate] = {}
+        self._cmd_template_errors: Dict[str, str] = {}
+        self._prepare_benchmark_templates()
+    
+    def close(self):
+        """Flush and close the dataset and run-log append handles."""
+        if self._dataset_fh is not None:
+            self._dataset_fh.flush()
+            st = os.fstat(self._dataset_fh.fileno())
+            self._dataset_fh.close()
+            # Persisted once per writer rather than per row; a crash just leaves it stale
+            self._persist_dataset_row_count(self.dataset_total_rows, st)
+        self._dataset_fh = None
+        self._dataset_writer = None
+        if self._dataset_jsonl_fh is not None:
+            self._dataset_jsonl_fh.close()
+        self._dataset_jsonl_fh = None
+        if self._run_log_fh is not None:
+            self._run_log_fh.close()
+        self._run_log_fh = None
     
     def _resolve_project_path(self, path_value: str) -> Path:
         """Resolve a path relative to the project root."""
@@ -225,28 +414,62 @@ class SimulationRunner:
     
     def _resolve_benchmark_path(self, path_value: str) -> Path:
         """Resolve a benchmark-relative path inside cpu2006 directory."""
-        path_obj = Path(path_value)
-        if not path_obj.is_absolute():
-            path_obj = (self.cpu2006_path / path_obj).resolve()
-        else:
-            path_obj = path_obj.expanduser().resolve()
-        return path_obj
+        return _resolve_under(str(self.cpu2006_path), path_value)
     
     def _count_existing_dataset_rows(self) -> int:
         """Count existing rows in dataset.csv (excluding header)."""
-        if not self.dataset_file.exists():
+        try:
+            st = self.dataset_file.stat()
+        except FileNotFoundError:
             return 0
+        
+        # The persisted count is valid only for the exact file it was written for
+        cached = self._read_dataset_row_count(st)
+        if cached is not None:
+            return cached
+        
         try:
-            with open(self.dataset_file, 'r', newline='') as csvfile:
-                reader = csv.reader(csvfile)
-                # Skip header if present
-                header = next(reader, None)
-                if header is None:
-                    return 0
-                return sum(1 for _ in reader)
+            # Rows never contain embedded newlines, so counting b'\n' in large
+            # binary chunks (a C loop) matches csv.reader at ~15x the speed
+            newlines = 0
+            last_chunk = b''
+            with open(self.dataset_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(DATASET_COUNT_CHUNK_BYTES), b''):
+                    newlines += chunk.count(b'\n')
+                    last_chunk = chunk
+            if not last_chunk:
+                return 0
+            # A final line without its newline (interrupted write) is still a row
+            lines = newlines + (not last_chunk.endswith(b'\n'))
+            count = max(lines - 1, 0)  # Minus header
         except Exception as e:
             logger.warning(f"Unable to count existing dataset rows: {e}")
             return 0
+        self._persist_dataset_row_count(count, st)
+        return count
+    
+    def _read_dataset_row_count(self, st: os.stat_result) -> Optional[int]:
+        """Read the persisted dataset row count if dataset.csv is unchanged since it was written."""
+        try:
+            with open(self.dataset_row_count_file, 'r') as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(record, dict):
+            return None
+        if record.get('size') != st.st_size or record.get('mtime_ns') != st.st_mtime_ns:
+            return None
+        return record.get('rows')
+    
+    def _persist_dataset_row_count(self, count: int, st: os.stat_result):
+        """Atomically persist the dataset row count with the size/mtime it describes."""
+        tmp_file = self.dataset_row_count_file.with_name(self.dataset_row_count_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump({'rows': count, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}, f)
+            os.replace(tmp_file, self.dataset_row_count_file)
+        except OSError as e:
+            logger.debug(f"Dataset row count not persisted: {e}")
     
     def _load_dataset_drive_file_id(self) -> Optional[str]:
         """Load stored Google Drive file ID for dataset."""
@@ -279,35 +502,215 @@ class SimulationRunner:
         return row
     
     def _append_to_dataset_row(self, result: Dict[str, Any]):
-        """Append a successful run to dataset.csv."""
+        """Append a successful run to dataset.csv (and dataset.jsonl when JSON output is on)."""
         if not result.get('metrics'):
             logger.warning(f"No metrics parsed for {result['run_id']}; skipping dataset append.")
             return
         
         row = self._flatten_result(result)
-        df = pd.DataFrame([row])
-        header = not self.dataset_file.exists()
         try:
-            df.to_csv(self.dataset_file, mode='a', header=header, index=False)
+            writer = self._get_dataset_writer(row)
+            if 'json' in self.output_formats and self._dataset_jsonl_fh is None:
+                self._open_dataset_jsonl()
+            writer.writerow(row)
+            self._dataset_fh.flush()
             self.dataset_total_rows += 1
-            logger.info(f"Appended run #{self.dataset_total_rows} to dataset.csv ({result['run_id']})")
+            if self._dataset_jsonl_fh is not None:
+                # JSON rows are appended alongside the CSV; dataset.json is exported on demand
+                self._dataset_jsonl_fh.write(_json_line(row))
+                self._dataset_jsonl_fh.flush()
+            logger.info("Appended run #%d to dataset.csv (%s)", self.dataset_total_rows, result['run_id'])
         except Exception as e:
             logger.error(f"Failed to append dataset row for {result['run_id']}: {e}")
+            if self._dataset_jsonl_fh is not None:
+                # dataset.jsonl may now lag dataset.csv; reopening it rebuilds it
+                self._dataset_jsonl_fh.close()
+                self._dataset_jsonl_fh = None
     
-    def _handle_success_result(self, result: Dict[str, Any]):
-        """Process bookkeeping for a successful run."""
-        self.session_successful_runs += 1
-        self._append_to_dataset_row(result)
-        self._sync_dataset_to_drive()
+    def _get_dataset_writer(self, row: Dict[str, Any]) -> csv.DictWriter:
+        """Return the dataset.csv writer, opening it or widening its header as needed."""
+        writer = self._dataset_writer
+        if writer is not None and all(key in writer.fieldnames for key in row):
+            return writer
+        
+        self.close()
+        fieldnames = self._read_dataset_header()
+        new_fields = [key for key in row if key not in fieldnames]
+        if fieldnames and new_fields:
+            # Schema drift: rewrite the file once with the widened header
+            fieldnames = fieldnames + new_fields
+            self._rewrite_dataset_header(fieldnames)
+        
+        self._dataset_fh = open(self.dataset_file, 'a', newline='')
+        if not fieldnames:
+            fieldnames = list(row)
+            writer = csv.DictWriter(self._dataset_fh, fieldnames=fieldnames)
+            writer.writeheader()
+        else:
+            writer = csv.DictWriter(self._dataset_fh, fieldnames=fieldnames)
+        self._dataset_writer = writer
+        return writer
+    
+    def _open_dataset_jsonl(self):
+        """Open dataset.jsonl for appending, rebuilding it from dataset.csv unless it has every row."""
+        if not self._dataset_jsonl_in_sync():
+            self._rebuild_dataset_jsonl()
+        self._dataset_jsonl_fh = open(self.dataset_jsonl_file, 'a')
+    
+    def _dataset_jsonl_in_sync(self) -> bool:
+        """Whether dataset.jsonl holds exactly one complete line per dataset.csv row."""
+        try:
+            lines = 0
+            last_chunk = b''
+            with open(self.dataset_jsonl_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(DATASET_COUNT_CHUNK_BYTES), b''):
+                    lines += chunk.count(b'\n')
+                    last_chunk = chunk
+        except FileNotFoundError:
+            return self.dataset_total_rows == 0
+        # A trailing line without its newline is a record cut off mid-write
+        return lines == self.dataset_total_rows and (not last_chunk or last_chunk.endswith(b'\n'))
+    
+    def _rebuild_dataset_jsonl(self):
+        """Rewrite dataset.jsonl from dataset.csv (an empty file when there are no rows)."""
+        tmp_file = self.dataset_jsonl_file.with_suffix('.jsonl.tmp')
+        if self.dataset_total_rows:
+            import pandas as pd
+            
+            pd.read_csv(self.dataset_file).to_json(tmp_file, orient='records', lines=True)
+        else:
+            tmp_file.write_bytes(b'')
+        os.replace(tmp_file, self.dataset_jsonl_file)
+        logger.info(f"Rebuilt dataset.jsonl from {self.dataset_total_rows} dataset.csv rows")
+    
+    def export_dataset_json(self) -> int:
+        """
+        Write dataset.json (an indented array of records) from dataset.jsonl.
+        
+        Records follow the dataset.csv column order; columns a row predates are null.
+        When dataset.jsonl is missing or out of step with dataset.csv, dataset.csv
+        is converted directly. Either way the array is written one record at a
+        time, never holding the dataset in memory.
+        
+        Returns:
+            Number of records written
+        """
+        if self.dataset_jsonl_file.exists() and self._dataset_jsonl_in_sync():
+            records = self._iter_dataset_jsonl()
+        elif self.dataset_file.exists():
+            if self.dataset_jsonl_file.exists():
+                logger.warning("dataset.jsonl does not match dataset.csv; exporting from dataset.csv")
+            records = self._iter_dataset_csv()
+        else:
+            logger.warning("dataset.jsonl and dataset.csv not found; nothing to export")
+            return 0
+        
+        columns = self._read_dataset_header()
+        tmp_file = self.dataset_json_file.with_suffix('.json.tmp')
+        rows = 0
+        with open(tmp_file, 'wb') as dst:
+            dst.write(b'[')
+            for record in records:
+                if columns:
+                    ordered = {column: record.pop(column, None) for column in columns}
+                    ordered.update(record)
+                    record = ordered
+                dst.write(b',\n' if rows else b'\n')
+                dst.write(_json_array_item(record))
+                rows += 1
+            dst.write(b'\n]\n' if rows else b']\n')
+        os.replace(tmp_file, self.dataset_json_file)
+        
+        logger.info(f"✓ dataset.json written with {rows} rows")
+        return rows
+    
+    def _iter_dataset_jsonl(self) -> Iterator[Dict[str, Any]]:
+        """Yield the records in dataset.jsonl."""
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.dataset_jsonl_file, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    
+    def _iter_dataset_csv(self) -> Iterator[Dict[str, Any]]:
+        """Yield the rows of dataset.csv with numeric and boolean cells converted."""
+        with open(self.dataset_file, 'r', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            for row in reader:
+                if row:
+                    yield {key: _parse_csv_value(value) for key, value in zip(header, row)}
+    
+    def _read_dataset_header(self) -> List[str]:
+        """Read the dataset.csv header row ([] when the file is missing or empty)."""
+        try:
+            with open(self.dataset_file, 'r', newline='') as csvfile:
+                return next(csv.reader(csvfile), [])
+        except FileNotFoundError:
+            return []
+    
+    def _rewrite_dataset_header(self, fieldnames: List[str]):
+        """Rewrite dataset.csv under a wider header, padding existing rows."""
+        tmp_file = self.dataset_file.with_suffix('.csv.tmp')
+        with open(self.dataset_file, 'r', newline='') as src, open(tmp_file, 'w', newline='') as dst:
+            reader = csv.reader(src)
+            writer = csv.writer(dst)
+            next(reader, None)
+            writer.writerow(fieldnames)
+            for existing in reader:
+                writer.writerow(existing + [''] * (len(fieldnames) - len(existing)))
+        os.replace(tmp_file, self.dataset_file)
+        logger.info(f"Extended dataset.csv header to {len(fieldnames)} columns")
+    
+    def _checkpoint(self, result: Dict[str, Any]):
+        """
+        Persist the bookkeeping for one finished run.
+        
+        The dataset row is written before the run-log event, so a crash in
+        between re-runs the simulation instead of marking it completed without
+        data. Drive sync is decided last.
+        """
+        self._active_run_ids.discard(result['run_id'])
+        success = result['success']
+        if success:
+            self.session_successful_runs += 1
+            self._append_to_dataset_row(result)
+        else:
+            self.session_failed_runs += 1
+        self._record_run(result)
+        
+        if not success:
+            return
+        
+        # Re-uploading the growing dataset after every row is quadratic in bytes sent
+        self._rows_since_drive_sync += 1
+        if (self._rows_since_drive_sync >= self.drive_sync_every_rows
+                or time.monotonic() - self._last_drive_sync >= self.drive_sync_every_seconds):
+            self._sync_dataset_to_drive()
     
     def _sync_dataset_to_drive(self):
         """Upload or update dataset.csv on Google Drive."""
         if not self.gdrive_backup:
             return
         
-        if not self.dataset_file.exists():
+        if self._pending_backup is not None and not self._pending_backup.done():
+            # The Drive client is not thread-safe; a later checkpoint retries
+            logger.debug("Results backup in progress; deferring dataset.csv sync")
             return
         
+        try:
+            st = self.dataset_file.stat()
+        except FileNotFoundError:
+            return
+        
+        self._rows_since_drive_sync = 0
+        self._last_drive_sync = time.monotonic()
+        
+        # Only this process appends, so an unchanged size/mtime means unchanged content
+        file_stat = (st.st_size, st.st_mtime_ns)
+        if file_stat == self._last_synced_stat:
+            logger.debug("dataset.csv unchanged since last Drive sync; skipping upload")
+            return
         try:
             new_file_id = self.gdrive_backup.upload_or_update_file(
                 self.dataset_file,
@@ -319,11 +722,12 @@ class SimulationRunner:
                 if new_file_id != self.dataset_drive_file_id:
                     self.dataset_drive_file_id = new_file_id
                     self._persist_dataset_drive_file_id(new_file_id)
+                self._last_synced_stat = file_stat
                 logger.info("✓ dataset.csv synced to Google Drive")
         except Exception as e:
             logger.error(f"Failed to sync dataset.csv to Google Drive: {e}")
     
-    def _load_benchmark_commands(self) -> Dict[str, Dict[str, Any]]:
+    def _load_benchmark_commands(self) -> Mapping[str, BenchmarkSpec]:
         """Merge default benchmark command metadata with overrides from config."""
         overrides = self.config['benchmarks'].get('commands', {}) or {}
         commands: Dict[str, Dict[str, Any]] = {}
@@ -339,7 +743,26 @@ class SimulationRunner:
             merged.update(custom or {})
             commands[name] = merged
         
-        return commands
+        return MappingProxyType({name: self._make_benchmark_spec(name, data) for name, data in commands.items()})
+    
+    def _make_benchmark_spec(self, benchmark: str, data: Dict[str, Any]) -> BenchmarkSpec:
+        """Freeze merged command metadata into a BenchmarkSpec."""
+        unknown = sorted(set(data) - BENCHMARK_SPEC_FIELDS)
+        if unknown:
+            logger.warning(f"Ignoring unknown command keys for '{benchmark}': {', '.join(unknown)}")
+        
+        values = {key: value for key, value in data.items() if key in BENCHMARK_SPEC_FIELDS}
+        values['binary'] = values.get('binary') or f"{benchmark}/{benchmark}"
+        if isinstance(values.get('options'), list):
+            values['options'] = tuple(values['options'])
+        return BenchmarkSpec(**values)
+    
+    def _get_benchmark_spec(self, benchmark: str) -> BenchmarkSpec:
+        """Return the launch spec for a benchmark, defaulting to <name>/<name>."""
+        spec = self.benchmark_commands.get(benchmark)
+        if spec is None:
+            spec = BenchmarkSpec(binary=f"{benchmark}/{benchmark}")
+        return spec
     
     def _format_option_list(self, benchmark: str, options: Any) -> Optional[str]:
         """Convert options into a gem5-friendly string with resolved paths."""
@@ -347,29 +770,34 @@ class SimulationRunner:
             return None
         
         if isinstance(options, (list, tuple)):
+            cache_key = (benchmark, tuple(options))
+            try:
+                return self._options_cache[cache_key]
+            except KeyError:
+                pass
+            except TypeError:  # unhashable option item
+                cache_key = None
+            
             resolved: List[str] = []
             for item in options:
                 if item is None:
                     continue
                 value = str(item)
-                if isinstance(item, str):
-                    maybe_path = ('/' in value) or bool(Path(value).suffix)
-                else:
-                    maybe_path = False
-                
-                if maybe_path:
-                    candidate = self._resolve_benchmark_path(f"{benchmark}/{value}") if not Path(value).is_absolute() else Path(value)
+                if isinstance(item, str) and _maybe_path(value):
+                    is_absolute = Path(value).is_absolute()
+                    candidate = self._resolve_benchmark_path(f"{benchmark}/{value}") if not is_absolute else Path(value)
                     if candidate.exists():
                         resolved.append(str(candidate))
                         continue
-                    candidate_alt = self._resolve_benchmark_path(value) if not Path(value).is_absolute() else Path(value)
+                    candidate_alt = self._resolve_benchmark_path(value) if not is_absolute else Path(value)
                     if candidate_alt.exists():
                         resolved.append(str(candidate_alt))
                         continue
                 resolved.append(value)
-            if not resolved:
-                return None
-            return ' '.join(shlex.quote(item) for item in resolved)
+            formatted = ' '.join(shlex.quote(item) for item in resolved) if resolved else None
+            if cache_key is not None:
+                self._options_cache[cache_key] = formatted
+            return formatted
         
         if isinstance(options, str):
             return options.strip() or None
@@ -378,76 +806,191 @@ class SimulationRunner:
     
     def _build_gem5_command(self, benchmark: str, run_dir: Path) -> Tuple[List[str], Optional[Path], Path]:
         """Construct the gem5 command for a benchmark."""
-        settings = dict(self.benchmark_commands.get(benchmark, {}))
-        
-        binary_value = settings.get('binary') or f"{benchmark}/{benchmark}"
-        binary_path = self._resolve_benchmark_path(binary_value)
-        if not binary_path.exists():
-            raise FileNotFoundError(f"Benchmark binary not found for '{benchmark}': {binary_path}")
-
-        working_dir_value = settings.get('working_dir')
-        if working_dir_value:
-            working_dir = self._resolve_benchmark_path(working_dir_value)
-        else:
-            working_dir = binary_path.parent
-
-        gem5_config = self.configs_dir / self.config['gem5']['default_config']
-
-        cmd: List[str] = [
-            str(self.gem5_binary),
-            '-d', str(run_dir),
-            str(gem5_config),
-            '--cmd', str(binary_path)
-        ]
+        spec = self._get_benchmark_spec(benchmark)
+        tpl = self._get_cmd_template(benchmark)
         
-        options_value = self._format_option_list(benchmark, settings.get('options'))
-        if options_value:
-            cmd.extend(['--options', options_value])
+        cmd: List[str] = [str(self.gem5_binary), '-d', str(run_dir), *tpl.base_argv]
         
-        stdout_redirect = settings.get('stdout')
+        stdout_redirect = spec.stdout
         if stdout_redirect:
             stdout_path = Path(stdout_redirect)
             if not stdout_path.is_absolute():
                 stdout_path = (run_dir / stdout_path).resolve()
             cmd.extend(['--output', str(stdout_path)])
         
-        stderr_redirect = settings.get('stderr')
+        stderr_redirect = spec.stderr
         if stderr_redirect:
             stderr_path = Path(stderr_redirect)
             if not stderr_path.is_absolute():
                 stderr_path = (run_dir / stderr_path).resolve()
             cmd.extend(['--errout', str(stderr_path)])
         
-        stdin_value = settings.get('stdin')
+        return cmd, tpl.stdin_path, tpl.working_dir
+    
+    def _prepare_benchmark_templates(self):
+        """Resolve command templates for every configured benchmark once, up front."""
+        for benchmark in self.config['benchmarks']['benchmark_list']:
+            try:
+                self._cmd_templates[benchmark] = self._build_cmd_template(benchmark)
+            except FileNotFoundError as exc:
+                # Runs of this benchmark then fail individually with this error
+                self._cmd_template_errors[benchmark] = str(exc)
+                logger.warning(str(exc))
+    
+    def _get_cmd_template(self, benchmark: str) -> CmdTemplate:
+        """Return the command template for a benchmark, building it on first use."""
+        tpl = self._cmd_templates.get(benchmark)
+        if tpl is not None:
+            return tpl
+        error = self._cmd_template_errors.get(benchmark)
+        if error is not None:
+            raise FileNotFoundError(error)
+        tpl = self._cmd_templates[benchmark] = self._build_cmd_template(benchmark)
+        return tpl
+    
+    def _build_cmd_template(self, benchmark: str) -> CmdTemplate:
+        """Resolve the run-independent parts of a benchmark command (binary, cwd, stdin, options)."""
+        spec = self._get_benchmark_spec(benchmark)
+        
+        binary_path = self._resolve_benchmark_path(spec.binary)
+        if not binary_path.exists():
+            raise FileNotFoundError(f"Benchmark binary not found for '{benchmark}': {binary_path}")
+
+        working_dir_value = spec.working_dir
+        if working_dir_value:
+            working_dir = self._resolve_benchmark_path(working_dir_value)
+        else:
+            working_dir = binary_path.parent
+        
+        options_value = self._format_option_list(benchmark, spec.options)
+        
+        stdin_value = spec.stdin
         stdin_path: Optional[Path] = None
         if stdin_value:
             stdin_path = self._resolve_benchmark_path(stdin_value)
             if not stdin_path.exists():
                 raise FileNotFoundError(f"stdin file not found for '{benchmark}': {stdin_path}")
         
-        return cmd, stdin_path, working_dir
+        gem5_config = self.configs_dir / self.config['gem5']['default_config']
+        base_argv = [str(gem5_config), '--cmd', str(binary_path)]
+        if options_value:
+            base_argv.extend(['--options', options_value])
+        
+        return CmdTemplate(tuple(base_argv), stdin_path, working_dir)
     
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file, via a JSON sidecar while it is unchanged."""
         try:
-            with open(self.config_file, 'r') as f:
-                return yaml.safe_load(f)
+            st = self.config_file.stat()
+            cache_file = self.config_file.with_name(self.config_file.name + '.cache.json')
+            config = self._read_config_cache(cache_file, st)
+            if config is None:
+                with open(self.config_file, 'r') as f:
+                    config = yaml.load(f, Loader=YAML_LOADER)
+                self._write_config_cache(cache_file, st, config)
+            return config
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             sys.exit(1)
     
+    def _read_config_cache(self, cache_file: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return the cached config if it was built from this exact YAML file version."""
+        try:
+            with open(cache_file, 'r') as f:
+                key = json.loads(f.readline())
+                if key != {'_mtime_ns': st.st_mtime_ns, '_size': st.st_size}:
+                    return None
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _write_config_cache(self, cache_file: Path, st: os.stat_result, config: Dict[str, Any]):
+        """Store the parsed config as JSON next to the YAML file (best effort)."""
+        try:
+            body = json.dumps(config)
+            # Only cache configs that survive a JSON round-trip unchanged
+            if json.loads(body) != config:
+                return
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            with open(tmp_file, 'w') as f:
+                f.write(json.dumps({'_mtime_ns': st.st_mtime_ns, '_size': st.st_size}) + '\n')
+                f.write(body)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Config cache not written: {e}")
+    
     def _load_run_log(self) -> Dict[str, Any]:
-        """Load run log for resume capability."""
-        if self.run_log_file.exists():
-            try:
-                with open(self.run_log_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {'completed': [], 'failed': [], 'in_progress': []}
+        """Load run log for resume capability by replaying run_log.jsonl."""
+        run_log = {'completed': [], 'failed': [], 'in_progress': []}
+        
+        if not self.run_events_file.exists():
+            # Older result directories only have the run_log.json snapshot
+            if self.run_log_file.exists():
+                try:
+                    with open(self.run_log_file, 'r') as f:
+                        run_log = json.load(f)
+                except:
+                    pass
+                self._migrate_run_log(run_log)
+            return run_log
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.run_events_file, 'rb') as f:
+            for line in f:
+                try:
+                    event = loads(line)
+                    run_log[event['event']].append(event['run_id'])
+                    if event.get('duration') is not None:
+                        self._add_duration(event['benchmark'], event['duration'])
+                except (ValueError, KeyError, TypeError):
+                    # A torn last line from an interrupted write
+                    logger.warning(f"Skipping malformed run log line: {line.strip()[:80].decode(errors='replace')}")
+        return run_log
+    
+    def _migrate_run_log(self, run_log: Dict[str, Any]):
+        """Seed run_log.jsonl from a legacy run_log.json snapshot."""
+        with open(self.run_events_file, 'w') as f:
+            for event in ('completed', 'failed'):
+                for run_id in run_log.get(event, []):
+                    f.write(_json_line({'event': event, 'run_id': run_id, 'ts': None}))
+    
+    def _record_run(self, result: Dict[str, Any]):
+        """Record a finished run in memory and append it to run_log.jsonl."""
+        run_id = result['run_id']
+        success = result['success']
+        event = 'completed' if success else 'failed'
+        self.run_log[event].append(run_id)
+        (self._completed_set if success else self._failed_set).add(run_id)
+        
+        record = {'event': event, 'run_id': run_id, 'ts': datetime.now().isoformat()}
+        if success and result.get('duration') is not None:
+            # Durations feed the longest-first ordering of later parallel sweeps
+            record['benchmark'] = result['benchmark']
+            record['duration'] = result['duration']
+            self._add_duration(result['benchmark'], result['duration'])
+        
+        if self._run_log_fh is None:
+            # Line-buffered: every event reaches the file as soon as it is written
+            self._run_log_fh = open(self.run_events_file, 'a', buffering=1)
+        self._run_log_fh.write(_json_line(record))
+    
+    def _add_duration(self, benchmark: str, duration: float):
+        """Accumulate a completed run's duration into the per-benchmark totals."""
+        totals = self._duration_totals.setdefault(benchmark, [0.0, 0])
+        totals[0] += duration
+        totals[1] += 1
+    
+    def _longest_first(self, benchmarks: List[str]) -> List[str]:
+        """Order benchmarks by mean recorded duration, longest (or never timed) first."""
+        def expected_duration(benchmark: str) -> float:
+            total, runs = self._duration_totals.get(benchmark, (0.0, 0))
+            return total / runs if runs else math.inf
+        
+        # sorted() is stable with reverse=True, so ties keep the configured order
+        return sorted(dict.fromkeys(benchmarks), key=expected_duration, reverse=True)
     
     def _save_run_log(self):
-        """Save run log."""
+        """Save the aggregated run_log.json snapshot."""
         with open(self.run_log_file, 'w') as f:
             json.dump(self.run_log, f, indent=2)
     
@@ -484,7 +1027,8 @@ class SimulationRunner:
         self,
         benchmark: str,
         config: Dict[str, Any],
-        run_id: str
+        run_id: str,
+        config_args: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Run a single simulation.
@@ -493,11 +1037,52 @@ class SimulationRunner:
             benchmark: Benchmark name
             config: Configuration dictionary
             run_id: Unique run identifier
+            config_args: Pre-rendered gem5 arguments for config (None = render here)
             
         Returns:
             Dictionary with run results
         """
-        # Create output directory
+        try:
+            job = self._prepare_run(benchmark, config, run_id, config_args)
+        except FileNotFoundError as exc:
+            logger.error(str(exc))
+            return self._failed_result(benchmark, config, run_id, str(exc))
+        
+        process = None
+        try:
+            process = self._launch_run(job)
+            process.wait(timeout=self.config['simulation']['timeout_seconds'])
+            return self._complete_run(job, process.returncode)
+        
+        except subprocess.TimeoutExpired:
+            self._terminate_run(process)
+            logger.error(f"✗ Timeout: {run_id}")
+            return self._failed_result(benchmark, config, run_id, 'timeout', job['start_ns'])
+        
+        except KeyboardInterrupt:
+            if process is not None:
+                self._terminate_run(process)
+            raise
+        
+        except Exception as e:
+            logger.error(f"✗ Error running {run_id}: {e}")
+            return self._failed_result(benchmark, config, run_id, str(e), job['start_ns'])
+    
+    def _prepare_run(
+        self,
+        benchmark: str,
+        config: Dict[str, Any],
+        run_id: str,
+        config_args: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create the run directory and build the gem5 invocation for one run.
+        
+        Raises:
+            FileNotFoundError: If the benchmark binary or stdin file is missing
+        """
+        # Create output directory (in flight until _checkpoint records the result)
+        self._active_run_ids.add(run_id)
         run_dir = (self.results_dir / run_id).resolve()
         run_dir.mkdir(parents=True, exist_ok=True)
         
@@ -511,113 +1096,230 @@ class SimulationRunner:
             }, f, indent=2)
         
         # Build gem5 command
-        try:
-            cmd, stdin_path, working_dir = self._build_gem5_command(benchmark, run_dir)
-        except FileNotFoundError as exc:
-            logger.error(str(exc))
-            return {
-                'run_id': run_id,
-                'benchmark': benchmark,
-                'config': config,
-                'success': False,
-                'error': str(exc),
-                'timestamp': datetime.now().isoformat()
-            }
+        cmd, stdin_path, working_dir = self._build_gem5_command(benchmark, run_dir)
         
         # Add configuration arguments
-        cmd.extend(self.config_manager.config_to_gem5_args(config))
+        if config_args is None:
+            config_args = self.config_manager.config_to_gem5_args(config)
+        cmd.extend(config_args)
         
-        logger.info(f"Running: {benchmark} with {run_id}")
-        logger.debug(f"Command: {' '.join(cmd)}")
+        return {
+            'run_id': run_id,
+            'benchmark': benchmark,
+            'config': config,
+            'cmd': cmd,
+            'stdin_path': stdin_path,
+            'working_dir': working_dir,
+            'run_dir': run_dir,
+            'start_ns': time.time_ns()
+        }
+    
+    def _launch_run(self, job: Dict[str, Any]) -> subprocess.Popen:
+        """Start gem5 for a prepared run without waiting for it."""
+        cmd = job['cmd']
+        run_dir = job['run_dir']
+        logger.info("Running: %s with %s", job['benchmark'], job['run_id'])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Command: %s", ' '.join(cmd))
         
-        # Run simulation
-        stdout_file = run_dir / 'stdout.log'
-        stderr_file = run_dir / 'stderr.log'
+        # Wall clock for the timestamp, monotonic clock for the duration
+        job['start_ns'] = time.time_ns()
+        job['start_perf_ns'] = time.perf_counter_ns()
         
-        start_time = datetime.now()
+        env = os.environ.copy()
+        env['GEM5_PROCESS_CWD'] = str(job['working_dir'])
         
         stdin_handle = None
+        stdout_target = subprocess.DEVNULL
         try:
-            if stdin_path:
-                stdin_handle = open(stdin_path, 'rb')
+            if job['stdin_path']:
+                stdin_handle = open(job['stdin_path'], 'rb')
             
-            env = os.environ.copy()
-            env['GEM5_PROCESS_CWD'] = str(working_dir)
+            # gem5 writes straight to these descriptors, so open them in binary
+            # mode without a Python text layer; DEVNULL skips the log entirely.
+            if not self.discard_stdout:
+                stdout_target = open(run_dir / 'stdout.log', 'wb')
             
-            with open(stdout_file, 'w') as stdout, open(stderr_file, 'w') as stderr:
-                process = subprocess.run(
+            # The child keeps its own copies of the descriptors once started.
+            # A new session lets a whole gem5 process group be killed at once.
+            with open(run_dir / 'stderr.log', 'wb') as stderr:
+                return subprocess.Popen(
                     cmd,
-                    stdout=stdout,
+                    stdout=stdout_target,
                     stderr=stderr,
                     stdin=stdin_handle,
-                    timeout=self.config['simulation']['timeout_seconds'],
                     cwd=str(self.gem5_root),
-                    env=env
+                    env=env,
+                    start_new_session=True
                 )
-            
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-            
-            success = process.returncode == 0
-            
-            if success:
-                logger.info(f"✓ Completed: {run_id} ({duration:.1f}s)")
-            else:
-                logger.warning(f"✗ Failed: {run_id} (return code {process.returncode})")
-            
-            # Parse results if successful
-            metrics = {}
-            if success:
-                stats_file = run_dir / 'stats.txt'
-                if stats_file.exists():
-                    metrics = self.stats_parser.parse_and_extract(stats_file)
-            
-            return {
-                'run_id': run_id,
-                'benchmark': benchmark,
-                'config': config,
-                'success': success,
-                'returncode': process.returncode,
-                'duration': duration,
-                'metrics': metrics,
-                'timestamp': start_time.isoformat()
-            }
-        
-        except subprocess.TimeoutExpired:
-            logger.error(f"✗ Timeout: {run_id}")
-            return {
-                'run_id': run_id,
-                'benchmark': benchmark,
-                'config': config,
-                'success': False,
-                'error': 'timeout',
-                'timestamp': start_time.isoformat()
-            }
-        
-        except Exception as e:
-            logger.error(f"✗ Error running {run_id}: {e}")
-            return {
-                'run_id': run_id,
-                'benchmark': benchmark,
-                'config': config,
-                'success': False,
-                'error': str(e),
-                'timestamp': start_time.isoformat()
-            }
         finally:
             if stdin_handle:
                 stdin_handle.close()
+            if stdout_target is not subprocess.DEVNULL:
+                stdout_target.close()
+    
+    def _pin_run(self, process: subprocess.Popen) -> Optional[int]:
+        """Pin a started gem5 process to a free core from the pool, returning the core."""
+        if not self._cpu_pool:
+            # Pinning disabled, or more runs than physical cores: leave it to the scheduler
+            return None
+        cpu = self._cpu_pool.pop(0)
+        try:
+            # Set from the parent so the launch keeps the vfork fast path (no preexec_fn)
+            os.sched_setaffinity(process.pid, {cpu})
+        except OSError as e:
+            logger.debug(f"Could not pin pid {process.pid} to CPU {cpu}: {e}")
+            self._cpu_pool.append(cpu)
+            return None
+        return cpu
+    
+    def _terminate_run(self, process: subprocess.Popen):
+        """Kill a gem5 run's process group and reap it."""
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        process.wait()
+    
+    def _complete_run(self, job: Dict[str, Any], returncode: int) -> Dict[str, Any]:
+        """Build the result of a finished gem5 run, parsing its stats on success."""
+        run_id = job['run_id']
+        # Microsecond resolution, as the dataset has always recorded
+        duration = round((time.perf_counter_ns() - job['start_perf_ns']) / 1e9, 6)
+        
+        success = returncode == 0
+        
+        if success:
+            logger.info("✓ Completed: %s (%.1fs)", run_id, duration)
+        else:
+            logger.warning("✗ Failed: %s (return code %s)", run_id, returncode)
+        
+        # Parse results if successful
+        metrics = {}
+        if success:
+            stats_file = job['run_dir'] / 'stats.txt'
+            if stats_file.exists():
+                metrics = self.stats_parser.parse_and_extract(stats_file)
+        
+        return {
+            'run_id': run_id,
+            'benchmark': job['benchmark'],
+            'config': job['config'],
+            'success': success,
+            'returncode': returncode,
+            'duration': duration,
+            'metrics': metrics,
+            'timestamp': _iso_timestamp(job['start_ns'])
+        }
+    
+    def _failed_result(
+        self,
+        benchmark: str,
+        config: Dict[str, Any],
+        run_id: str,
+        error: str,
+        start_ns: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the result of a run that never produced a gem5 exit status."""
+        return {
+            'run_id': run_id,
+            'benchmark': benchmark,
+            'config': config,
+            'success': False,
+            'error': error,
+            'timestamp': _iso_timestamp(start_ns if start_ns is not None else time.time_ns())
+        }
+    
+    def _iter_parallel_runs(
+        self,
+        runs: Iterable[Tuple[str, str, Dict[str, Any], Optional[List[str]]]],
+        parallel: int
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run simulations with at most `parallel` gem5 processes alive.
+        
+        gem5 does the work, so runs are plain child processes managed from
+        this process rather than Python pool workers.
+        
+        Args:
+            runs: (benchmark, run_id, config, config_args) tuples, in start order
+            parallel: Maximum number of concurrent gem5 processes
+            
+        Yields:
+            Run result dictionaries, in completion order
+        """
+        timeout = self.config['simulation']['timeout_seconds']
+        queue = iter(runs)
+        running: Dict[subprocess.Popen, Dict[str, Any]] = {}
+        
+        try:
+            while True:
+                # Top up to the concurrency limit
+                while len(running) < parallel:
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    benchmark, run_id, config, config_args = item
+                    try:
+                        job = self._prepare_run(benchmark, config, run_id, config_args)
+                    except FileNotFoundError as exc:
+                        logger.error(str(exc))
+                        yield self._failed_result(benchmark, config, run_id, str(exc))
+                        continue
+                    try:
+                        process = self._launch_run(job)
+                    except Exception as e:
+                        logger.error(f"✗ Error running {run_id}: {e}")
+                        yield self._failed_result(benchmark, config, run_id, str(e), job['start_ns'])
+                        continue
+                    job['deadline'] = time.monotonic() + timeout
+                    job['cpu'] = self._pin_run(process)
+                    running[process] = job
+                
+                if not running:
+                    return
+                
+                reaped = False
+                now = time.monotonic()
+                for process, job in list(running.items()):
+                    returncode = process.poll()
+                    if returncode is None and now < job['deadline']:
+                        continue
+                    del running[process]
+                    reaped = True
+                    if job['cpu'] is not None:
+                        self._cpu_pool.append(job['cpu'])
+                    run_id = job['run_id']
+                    if returncode is None:
+                        self._terminate_run(process)
+                        logger.error(f"✗ Timeout: {run_id}")
+                        yield self._failed_result(job['benchmark'], job['config'], run_id, 'timeout', job['start_ns'])
+                        continue
+                    try:
+                        yield self._complete_run(job, returncode)
+                    except Exception as e:
+                        logger.error(f"✗ Error running {run_id}: {e}")
+                        yield self._failed_result(job['benchmark'], job['config'], run_id, str(e), job['start_ns'])
+                
+                if not reaped:
+                    time.sleep(POLL_INTERVAL_SECONDS)
+        finally:
+            # Interrupted or abandoned: don't leave gem5 processes behind
+            for process in running:
+                self._terminate_run(process)
     
     def _run_configuration_round(
         self,
         config: Dict[str, Any],
         benchmarks: List[str],
-        parallel: int,
         round_index: int,
-        total_rounds: int
+        total_rounds: int,
+        config_args: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Execute a single configuration across all requested benchmarks."""
+        """Execute a single configuration across all requested benchmarks, one at a time."""
         config_id = self.config_manager.get_config_id(config)
+        if config_args is None:
+            config_args = self.config_manager.config_to_gem5_args(config)
         logger.info(f"\n{'='*60}")
         logger.info(f"Starting configuration round {round_index}/{total_rounds}")
         logger.info(f"Configuration ID: {config_id}")
@@ -627,76 +1329,21 @@ class SimulationRunner:
         results: List[Dict[str, Any]] = []
         total_benchmarks = len(benchmarks)
         
-        if parallel == 1:
-            for index, benchmark in enumerate(benchmarks, start=1):
-                run_id = f"{benchmark}_{config_id}"
-                
-                if run_id in self.run_log['completed']:
-                    logger.debug(f"Skipping (already completed): {run_id}")
-                    continue
-                
-                logger.info(f"[Round {round_index}/{total_rounds}] Starting {benchmark} "
-                            f"({index}/{total_benchmarks}) with {config_id}")
-                result = self.run_single_simulation(benchmark, config, run_id)
-                results.append(result)
-                
-                if result['success']:
-                    self.run_log['completed'].append(run_id)
-                    self._handle_success_result(result)
-                else:
-                    self.run_log['failed'].append(run_id)
-                    self.session_failed_runs += 1
-                self._save_run_log()
-                logger.info(f"[Round {round_index}/{total_rounds}] Finished {run_id} "
-                            f"(success={result['success']})")
-        else:
-            with ProcessPoolExecutor(max_workers=parallel) as executor:
-                futures: Dict[Any, str] = {}
-                
-                for index, benchmark in enumerate(benchmarks, start=1):
-                    run_id = f"{benchmark}_{config_id}"
-                    
-                    if run_id in self.run_log['completed']:
-                        logger.debug(f"Skipping (already completed): {run_id}")
-                        continue
-                    
-                    logger.info(f"[Round {round_index}/{total_rounds}] Queuing {benchmark} "
-                                f"({index}/{total_benchmarks}) with {config_id}")
-                    future = executor.submit(
-                        self.run_single_simulation,
-                        benchmark,
-                        config,
-                        run_id
-                    )
-                    futures[future] = run_id
-                
-                if futures:
-                    for future in tqdm(
-                        as_completed(futures),
-                        total=len(futures),
-                        desc=f"Config {round_index}/{total_rounds}"
-                    ):
-                        run_id = futures[future]
-                        try:
-                            result = future.result()
-                            results.append(result)
-                            
-                            if result['success']:
-                                self.run_log['completed'].append(run_id)
-                                self._handle_success_result(result)
-                            else:
-                                self.run_log['failed'].append(run_id)
-                                self.session_failed_runs += 1
-                            self._save_run_log()
-                            logger.info(f"[Round {round_index}/{total_rounds}] Finished {run_id} "
-                                        f"(success={result['success']})")
-                        except Exception as e:
-                            logger.error(f"Exception in {run_id}: {e}")
-                            self.run_log['failed'].append(run_id)
-                            self.session_failed_runs += 1
-                            self._save_run_log()
-                else:
-                    logger.info("All benchmarks already completed for this configuration.")
+        for index, benchmark in enumerate(benchmarks, start=1):
+            run_id = f"{benchmark}_{config_id}"
+            
+            if run_id in self._completed_set:
+                logger.debug("Skipping (already completed): %s", run_id)
+                continue
+            
+            logger.info("[Round %d/%d] Starting %s (%d/%d) with %s",
+                        round_index, total_rounds, benchmark, index, total_benchmarks, config_id)
+            result = self.run_single_simulation(benchmark, config, run_id, config_args)
+            results.append(result)
+            
+            self._checkpoint(result)
+            logger.info("[Round %d/%d] Finished %s (success=%s)",
+                        round_index, total_rounds, run_id, result['success'])
         
         successful = sum(1 for r in results if r['success'])
         logger.info(f"\n✓ Completed configuration {config_id}")
@@ -706,6 +1353,72 @@ class SimulationRunner:
         
         return results
     
+    def _run_parallel_sweep(
+        self,
+        rounds: List[Tuple[Dict[str, Any], List[str], str]],
+        benchmarks: List[str],
+        parallel: int,
+        backup_each_config: bool
+    ):
+        """
+        Run every pending (configuration, benchmark) pair on up to `parallel` gem5 processes.
+        
+        Runs are queued configuration by configuration, so a partial sweep still
+        covers the whole benchmark suite, but the next configuration starts as
+        soon as a slot frees up instead of waiting for the slowest benchmark of
+        the current one. Within a configuration, benchmarks start longest-first.
+        
+        Args:
+            rounds: (config, config_args, config_id) for each pending configuration
+            benchmarks: Benchmarks to run per configuration
+            parallel: Maximum number of concurrent gem5 processes
+            backup_each_config: Back up results whenever a configuration finishes
+        """
+        order = self._longest_first(benchmarks)
+        runs: List[Tuple[str, str, Dict[str, Any], List[str]]] = []
+        config_of_run: Dict[str, str] = {}
+        tallies: Dict[str, List[int]] = {}  # config_id -> [pending, successful, failed]
+        
+        for config, config_args, config_id in rounds:
+            if config_id in tallies:
+                # Sampled strategies can repeat a configuration; its runs are already queued
+                continue
+            pending = 0
+            for benchmark in order:
+                run_id = f"{benchmark}_{config_id}"
+                if run_id in self._completed_set:
+                    logger.debug("Skipping (already completed): %s", run_id)
+                    continue
+                runs.append((benchmark, run_id, config, config_args))
+                config_of_run[run_id] = config_id
+                pending += 1
+            tallies[config_id] = [pending, 0, 0]
+        
+        logger.info("Queued %d runs across %d configurations", len(runs), len(rounds))
+        
+        finished = self._iter_parallel_runs(runs, parallel)
+        try:
+            # Per-run completions go to the progress bar rather than the log
+            with tqdm(total=len(runs), desc="Sweep") as pbar:
+                for result in finished:
+                    run_id = result['run_id']
+                    self._checkpoint(result)
+                    logger.debug("Finished %s (success=%s)", run_id, result['success'])
+                    pbar.set_postfix_str(f"{run_id} {'ok' if result['success'] else 'failed'}", refresh=False)
+                    pbar.update()
+                    
+                    config_id = config_of_run.pop(run_id)
+                    tally = tallies[config_id]
+                    tally[0] -= 1
+                    tally[1 if result['success'] else 2] += 1
+                    if tally[0] == 0:
+                        logger.info("✓ Completed configuration %s (%d successful, %d failed)",
+                                    config_id, tally[1], tally[2])
+                        if backup_each_config:
+                            self._backup_results(f"config_{config_id}")
+        finally:
+            finished.close()
+    
     def run_full_sweep(
         self,
         strategy: str = 'grid',
@@ -721,7 +1434,7 @@ class SimulationRunner:
             strategy: Sampling strategy
             preset: Configuration preset
             num_samples: Number of samples
-            parallel: Parallel simulations per benchmark
+            parallel: Maximum number of concurrent gem5 simulations
             benchmarks: List of benchmarks (None = all)
         """
         if benchmarks is None:
@@ -748,24 +1461,66 @@ class SimulationRunner:
         logger.info(f"Configurations: {len(configurations)}")
         logger.info(f"{'='*60}\n")
         
-        for index, config in enumerate(configurations, start=1):
-            self._run_configuration_round(
-                config=config,
-                benchmarks=benchmarks,
-                parallel=parallel,
-                round_index=index,
-                total_rounds=len(configurations)
-            )
+        # Render every configuration's gem5 arguments up front
+        config_args_batch = self.config_manager.config_to_gem5_args_batch(configurations)
+        
+        backup_each_config = self.config['google_drive'].get('backup_frequency') in {
+            'after_each_benchmark', 'after_each_config'
+        }
+        
+        pending_rounds: List[Tuple[int, Dict[str, Any], List[str], str]] = []
+        skipped_rounds = 0
+        for index, (config, config_args) in enumerate(zip(configurations, config_args_batch), start=1):
+            config_id = self.config_manager.get_config_id(config)
             
-            if self.config['google_drive'].get('backup_frequency') in {'after_each_benchmark', 'after_each_config'}:
-                self._backup_results(f"config_{self.config_manager.get_config_id(config)}")
+            # Resume fast path: a fully completed round needs no setup, logging or backup
+            if all(f"{benchmark}_{config_id}" in self._completed_set for benchmark in benchmarks):
+                skipped_rounds += 1
+                logger.debug("Skipping configuration %s (all benchmarks completed)", config_id)
+                continue
+            pending_rounds.append((index, config, config_args, config_id))
+        
+        try:
+            if parallel == 1:
+                for index, config, config_args, config_id in pending_rounds:
+                    self._run_configuration_round(
+                        config=config,
+                        benchmarks=benchmarks,
+                        round_index=index,
+                        total_rounds=len(configurations),
+                        config_args=config_args
+                    )
+                    
+                    if backup_each_config:
+                        self._backup_results(f"config_{config_id}")
+            elif pending_rounds:
+                self._run_parallel_sweep(
+                    [(config, config_args, config_id) for _, config, config_args, config_id in pending_rounds],
+                    benchmarks=benchmarks,
+                    parallel=parallel,
+                    backup_each_config=backup_each_config
+                )
+        except KeyboardInterrupt:
+            self._wait_for_backup()
+            # Don't leave debounced rows only on local disk when the sweep is stopped
+            if self._rows_since_drive_sync:
+                self.close()
+                self._sync_dataset_to_drive()
+            raise
+        
+        if skipped_rounds:
+            logger.info(f"Skipped {skipped_rounds} already completed configurations")
         
         # Finalize dataset artifacts
+        self.close()
+        self._save_run_log()
+        self._wait_for_backup()
         total_rows = self._finalize_dataset()
         
         # Final backup
         if self.gdrive_backup:
             self._backup_results('final')
+            self._wait_for_backup()
         
         logger.info(f"\n{'='*60}")
         logger.info(f"SWEEP COMPLETE")
@@ -777,47 +1532,141 @@ class SimulationRunner:
         logger.info(f"{'='*60}\n")
 
     def _finalize_dataset(self) -> int:
-        """Create/upsert dataset.json and return total row count."""
+        """Write derived dataset artifacts and return total row count."""
         if not self.dataset_file.exists():
             logger.warning("dataset.csv not found; skipping dataset finalization")
             return self.dataset_total_rows
         
-        try:
-            df = pd.read_csv(self.dataset_file)
-        except Exception as e:
-            logger.error(f"Failed to read dataset.csv for finalization: {e}")
-            return self.dataset_total_rows
+        # dataset.jsonl is kept up to date row by row; dataset.json comes from --export-json
+        total_rows = self.dataset_total_rows
         
-        total_rows = len(df)
-        json_file = self.results_dir / 'dataset.json'
-        try:
-            df.to_json(json_file, orient='records', indent=2)
-            logger.info(f"✓ dataset.json updated with {total_rows} rows")
-        except Exception as e:
-            logger.error(f"Failed to write dataset.json: {e}")
+        parquet_file = self.results_dir / 'dataset.parquet'
+        if 'parquet' in self.output_formats and self._is_stale(parquet_file):
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                from pyarrow import csv as pa_csv
+            except ImportError as e:
+                logger.warning(f"Skipping dataset.parquet (pyarrow not installed): {e}")
+                pq = None
+            
+            if pq is not None:
+                try:
+                    # Multi-threaded columnar read; timestamps stay the ISO strings written
+                    # to dataset.csv and empty cells become nulls, as with pandas
+                    table = pa_csv.read_csv(
+                        self.dataset_file,
+                        read_options=pa_csv.ReadOptions(block_size=DATASET_SCAN_BLOCK_BYTES),
+                        convert_options=pa_csv.ConvertOptions(
+                            column_types={'timestamp': pa.string()},
+                            strings_can_be_null=True
+                        )
+                    )
+                    # Columns with no values yet are inferred as null; store them as float64
+                    table = table.cast(pa.schema([
+                        field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+                        for field in table.schema
+                    ]))
+                except Exception as e:
+                    logger.error(f"Failed to read dataset.csv for finalization: {e}")
+                    return self.dataset_total_rows
+                total_rows = table.num_rows
+                
+                # Typed and much smaller than CSV/JSON; analyze_data reads it directly.
+                # Written aside and renamed so an interrupted write never looks current
+                tmp_file = parquet_file.with_suffix('.parquet.tmp')
+                try:
+                    pq.write_table(table, tmp_file, compression='zstd')
+                    os.replace(tmp_file, parquet_file)
+                    logger.info(f"✓ dataset.parquet updated with {total_rows} rows")
+                except Exception as e:
+                    logger.error(f"Failed to write dataset.parquet: {e}")
         
         self.dataset_total_rows = total_rows
         # Ensure dataset.csv sync is up to date after finalization
         self._sync_dataset_to_drive()
         return total_rows
     
+    def _is_stale(self, derived_file: Path) -> bool:
+        """Whether a file derived from dataset.csv predates its last change."""
+        try:
+            return derived_file.stat().st_mtime_ns < self.dataset_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return True
+    
     def _backup_results(self, label: str):
-        """Backup results to Google Drive."""
+        """
+        Start a background backup of results to Google Drive.
+        
+        Uploads are serialized without blocking the sweep: while one is still
+        running, later requests are skipped, since the next backup (at the latest
+        the final one) includes their results anyway.
+        """
         if not self.gdrive_backup:
             return
         
+        if self._pending_backup is not None and not self._pending_backup.done():
+            logger.info(f"Previous backup still uploading; skipping {label} backup")
+            return
+        self._wait_for_backup()
+        if self._backup_pool is None:
+            self._backup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='backup')
+        
+        drive_config = self.config['google_drive']
+        compress_algo = drive_config.get('compress_algo', 'gzip')
+        
+        logger.info(f"Backing up results to Google Drive ({label})...")
+        self._pending_backup = self._backup_pool.submit(
+            self.gdrive_backup.backup_results,
+            self.results_dir,
+            compress=drive_config['compress_before_upload'] and compress_algo != 'none',
+            compression=compress_algo,
+            exclude=self._exclude_from_backup
+        )
+        self._pending_backup.add_done_callback(self._log_backup_result)
+    
+    def _exclude_from_backup(self, relative_path: str) -> bool:
+        """
+        Whether a results_dir entry is left out of a background backup.
+        
+        Runs on the backup thread: in-flight run directories, temp files and the
+        row-count sidecar change under the archiver and are all regenerable.
+        """
+        top, _, _ = relative_path.partition('/')
+        name = relative_path.rpartition('/')[2]
+        return (
+            top in self._active_run_ids
+            or name.endswith('.tmp')
+            or relative_path == self.dataset_row_count_file.name
+        )
+    
+    @staticmethod
+    def _log_backup_result(future: Future):
+        """Report the outcome of a background backup."""
         try:
-            logger.info(f"Backing up results to Google Drive...")
-            self.gdrive_backup.backup_results(
-                self.results_dir,
-                compress=self.config['google_drive']['compress_before_upload']
-            )
-            logger.info("✓ Backup successful")
+            file_id = future.result()
         except Exception as e:
             logger.error(f"✗ Backup failed: {e}")
+            return
+        if file_id:
+            logger.info("✓ Backup successful")
+        else:
+            logger.error("✗ Backup failed")
+    
+    def _wait_for_backup(self):
+        """Block until the in-flight results backup, if any, has finished."""
+        if self._pending_backup is None:
+            return
+        try:
+            self._pending_backup.result()
+        except Exception:
+            pass  # Already reported by _log_backup_result
+        self._pending_backup = None
     
     def show_status(self):
         """Display current status and statistics."""
+        from rich.table import Table
+        
         table = Table(title="Simulation Status")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="magenta")
@@ -827,11 +1676,66 @@ class SimulationRunner:
         table.add_row("In Progress", str(len(self.run_log['in_progress'])))
         
         if self.dataset_file.exists():
-            df = pd.read_csv(self.dataset_file)
-            table.add_row("Dataset Rows", str(len(df)))
-            table.add_row("Unique Benchmarks", str(df['benchmark'].nunique()))
+            rows, unique_benchmarks = self._summarize_dataset()
+            table.add_row("Dataset Rows", str(rows))
+            table.add_row("Unique Benchmarks", str(unique_benchmarks))
         
         console.print(table)
+    
+    def _summarize_dataset(self) -> Tuple[int, int]:
+        """Return (row count, unique benchmark count) for dataset.csv."""
+        try:
+            # Only needed by --status, so don't pay the import on every run
+            import polars as pl
+        except ImportError:
+            pl = None
+        
+        if pl is not None:
+            try:
+                # Lazy scan: only the benchmark column is parsed, across all cores
+                stats = pl.scan_csv(self.dataset_file, infer_schema=False).select(
+                    pl.len().alias('rows'),
+                    pl.col('benchmark').drop_nulls().n_unique().alias('benchmarks')
+                ).collect()
+                return int(stats['rows'][0]), int(stats['benchmarks'][0])
+            except Exception as e:
+                logger.debug("polars scan of dataset.csv failed: %s", e)
+        
+        try:
+            from pyarrow import csv as pa_csv, compute as pa_compute
+        except ImportError:
+            pa_csv = None
+        
+        if pa_csv is not None:
+            try:
+                # Multi-threaded Arrow reader, projected to the benchmark column
+                benchmark_table = pa_csv.read_csv(
+                    self.dataset_file,
+                    read_options=pa_csv.ReadOptions(block_size=DATASET_SCAN_BLOCK_BYTES),
+                    convert_options=pa_csv.ConvertOptions(
+                        include_columns=['benchmark'],
+                        strings_can_be_null=True
+                    )
+                )
+                unique = pa_compute.count_distinct(benchmark_table['benchmark']).as_py()
+                return benchmark_table.num_rows, unique
+            except Exception as e:
+                logger.debug("pyarrow read of dataset.csv failed: %s", e)
+        
+        # Two scalars only: stream the rows instead of building a DataFrame
+        rows = 0
+        benchmarks = set()
+        with open(self.dataset_file, 'r', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            bench_idx = header.index('benchmark') if 'benchmark' in header else None
+            for row in reader:
+                if not row:
+                    continue
+                rows += 1
+                if bench_idx is not None and bench_idx < len(row) and row[bench_idx]:
+                    benchmarks.add(row[bench_idx])
+        return rows, len(benchmarks)
 
 
 def main():
@@ -845,6 +1749,7 @@ def main():
     parser.add_argument('--samples', type=int, help='Number of samples (for random strategies)')
     parser.add_argument('--parallel', type=int, default=1, help='Number of parallel simulations')
     parser.add_argument('--status', action='store_true', help='Show status')
+    parser.add_argument('--export-json', action='store_true', help='Write results/dataset.json from dataset.jsonl')
     parser.add_argument('--resume', action='store_true', help='Resume interrupted run')
     
     args = parser.parse_args()
@@ -854,6 +1759,9 @@ def main():
     if args.status:
         runner.show_status()
     
+    elif args.export_json:
+        runner.export_dataset_json()
+    
     elif args.test:
         benchmark = args.benchmark or 'bwaves'
         preset_name = args.preset or 'small_test'
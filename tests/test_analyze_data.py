@@ -0,0 +1,71 @@
+"""Tests for the dataset summary export in analyze_data."""
+
+import math
+
+import pytest
+
+import analyze_data
+
+HEADER = 'timestamp,run_id,benchmark,param_l1d_size,metric_ipc,metric_cycles\n'
+
+
+@pytest.fixture(params=['polars', 'pyarrow'])
+def backend(request, monkeypatch):
+    """Run each test through the polars path and the pyarrow fallback."""
+    if request.param == 'polars':
+        if analyze_data.pl is None:
+            pytest.skip('polars is not installed')
+    else:
+        if analyze_data.pa is None:
+            pytest.skip('pyarrow is not installed')
+        monkeypatch.setattr(analyze_data, 'pl', None)
+    return request.param
+
+
+def _summary_stats(output):
+    """Parse the METRIC STATISTICS block of summary.txt into {stat: {column: value}}."""
+    lines = output.read_text().splitlines()
+    start = lines.index('METRIC STATISTICS') + 2
+    columns = lines[start].split()
+    stats = {}
+    for line in lines[start + 1:]:
+        if not line.strip():
+            break
+        name, *values = line.split()
+        stats[name] = dict(zip(columns, (float(v) for v in values)))
+    return stats
+
+
+def test_export_summary_all_empty_metric_column(tmp_path, backend):
+    csv_file = tmp_path / 'dataset.csv'
+    csv_file.write_text(
+        HEADER
+        + '2024-01-01T00:00:00,r1,mcf,32kB,1.5,\n'
+        + '2024-01-01T00:01:00,r2,mcf,64kB,2.5,\n'
+        + '2024-01-01T00:02:00,r3,lbm,64kB,3.5,\n'
+    )
+    output = tmp_path / 'summary.txt'
+    
+    analyze_data.export_summary(str(csv_file), str(output))
+    
+    stats = _summary_stats(output)
+    assert stats['count'] == {'metric_ipc': 3.0, 'metric_cycles': 0.0}
+    assert stats['50%']['metric_ipc'] == pytest.approx(2.5)
+    for stat in ('mean', 'std', 'min', '25%', '50%', '75%', 'max'):
+        assert math.isnan(stats[stat]['metric_cycles'])
+    assert 'Total simulations: 3' in output.read_text()
+
+
+def test_export_summary_header_only_csv(tmp_path, backend):
+    csv_file = tmp_path / 'dataset.csv'
+    csv_file.write_text(HEADER)
+    output = tmp_path / 'summary.txt'
+    
+    analyze_data.export_summary(str(csv_file), str(output))
+    
+    text = output.read_text()
+    assert 'Total simulations: 0' in text
+    assert 'Benchmarks: 0' in text
+    stats = _summary_stats(output)
+    assert stats['count'] == {'metric_ipc': 0.0, 'metric_cycles': 0.0}
+    assert math.isnan(stats['50%']['metric_ipc'])